@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING
+from collections import deque
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QWidget
@@ -23,9 +25,17 @@ from app.settings_handling import SettingsHandlingMixin
 from app.preset_handling import PresetHandlingMixin
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from managers.requests_manager import RequestWorker
 
 
+@lru_cache(maxsize=None)
+def _app_icon() -> QIcon:
+    """Return the window icon, loaded from disk on first use."""
+    return QIcon(str(resource_path("api_tester_icon.ico")))
+
+
 class ApiTestApp(  # type: ignore[misc]
     QWidget,
     UIBuilderMixin,
@@ -78,15 +88,31 @@ class ApiTestApp(  # type: ignore[misc]
         )
 
         self.setWindowTitle("API Test Tool")
-        self.setWindowIcon(QIcon(str(resource_path("api_tester_icon.ico"))))
+        self.setWindowIcon(_app_icon())
         self.resize(1200, 720)
 
         # Request tracking
         self.active_requests: list[RequestWorker] = []
         self.current_request_count: int = 0
         self.total_request_count: int = 0
+        # Response entries waiting for the next batched append (see display_response)
+        self._pending_responses: list[str] = []
+
+        # Last preset-search result, reused when the next search extends it
+        self._last_search: str = ""
+        self._search_bucket: list[tuple[str, dict[str, Any]]] | None = None
+        self._search_matches: list[tuple[str, dict[str, Any]]] = []
+
+        # Multi-preset batch run state (see PresetHandlingMixin.run_multiple)
+        self._multi_queue: deque[str] = deque()
+        self._multi_ip: str = ""
+        self._multi_password: str = ""
+        self._multi_log_file: Path | None = None
+        self._multi_total: int = 0
+        self._multi_in_flight: int = 0
 
         self.apply_light_theme()
+        self._setup_settings_auto_save()
         self.build_ui()
         self.load_settings()
         self.update_presets_list()
@@ -1,7 +1,7 @@
 """Dialogs for API Test Tool — modern design."""
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -9,7 +9,6 @@ from PySide6.QtWidgets import (
     QListWidget,
     QPushButton,
     QCheckBox,
-    QListWidgetItem,
     QLabel,
     QFrame,
 )
@@ -75,7 +74,7 @@ QPushButton[secondary="true"]:hover {{
 
 
 class MultiSelectDialog(QDialog):
-    """Dialog that lets the user choose multiple presets to run sequentially."""
+    """Dialog that lets the user choose multiple presets to run as a batch."""
 
     def __init__(self, items: list[str]) -> None:
         """Initialise the dialog and populate it with *items*.
@@ -94,7 +93,7 @@ class MultiSelectDialog(QDialog):
 
         title = QLabel("Select Presets to Run")
         title.setStyleSheet(f"font-size: 16px; font-weight: 700; color: {_TEXT};")
-        subtitle = QLabel("Choose the presets you want to execute sequentially.")
+        subtitle = QLabel("Choose the presets you want to execute as a batch.")
         subtitle.setStyleSheet(f"font-size: 12px; color: {_MUTED};")
         root.addWidget(title)
         root.addWidget(subtitle)
@@ -110,8 +109,9 @@ class MultiSelectDialog(QDialog):
 
         self.list_widget = QListWidget()
         self.list_widget.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        for item in items:
-            self.list_widget.addItem(QListWidgetItem(item))
+        # Every row is a single line of text, so Qt can skip per-item size hints
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.addItems(list(items))
         root.addWidget(self.list_widget, 1)
 
         btn_row = QHBoxLayout()
@@ -131,15 +131,20 @@ class MultiSelectDialog(QDialog):
         btn_row.addWidget(ok_btn)
         root.addLayout(btn_row)
 
+    @Slot(int)
     def toggle_select_all(self, state: int) -> None:
         """Select or deselect all items based on the *Select all* checkbox.
 
         :param state: Qt check state integer (``Qt.Checked`` selects all).
         """
-        checked = state == Qt.CheckState.Checked
-        for i in range(self.list_widget.count()):
-            self.list_widget.item(i).setSelected(checked)
-
+        # One range selection on the selection model instead of a
+        # selectionChanged + repaint per item
+        if state == Qt.CheckState.Checked:
+            self.list_widget.selectAll()
+        else:
+            self.list_widget.clearSelection()
+
+    @Slot()
     def accept_selection(self) -> None:
         """Store the selected item names and close the dialog with accept."""
         self.selected = [item.text() for item in self.list_widget.selectedItems()]
@@ -2,17 +2,24 @@
 from __future__ import annotations
 
 from collections import deque
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtWidgets import (
     QCheckBox, QComboBox, QInputDialog, QLabel,
     QLineEdit, QMessageBox, QWidget,
 )
 
 from app.dialogs import MultiSelectDialog
+from managers.presets import is_unhappy_json_file
+
+# Batch presets sent at once; the rest wait until one of these responds
+_MAX_CONCURRENT_PRESETS = 4
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from config.di_container import PresetManagerProtocol, RequestManagerProtocol
     from managers.requests_manager import RequestWorker
     from config.logging_system import StructuredLogger
@@ -36,9 +43,21 @@ if TYPE_CHECKING:
         logger: StructuredLogger
         current_request_count: int
         total_request_count: int
+        _last_search: str
+        _search_bucket: list[tuple[str, dict[str, Any]]] | None
+        _search_matches: list[tuple[str, dict[str, Any]]]
+        _multi_queue: deque[str]
+        _multi_ip: str
+        _multi_password: str
+        _multi_log_file: Path | None
+        _multi_total: int
+        _multi_in_flight: int
+        _endpoint_index: dict[str, int]
+        _json_type_index: dict[str, int]
 
         # Cross-mixin and internal method stubs
         def _validate_ip(self, ip: str) -> bool: ...
+        def _format_json_response(self, text: str) -> str: ...
         def _track_request(self, worker: RequestWorker) -> None: ...
         def _untrack_request(self, worker: RequestWorker) -> None: ...
         def _update_progress(self, completed: int, total: int) -> None: ...
@@ -46,6 +65,9 @@ if TYPE_CHECKING:
         def _preset_matches(self, preset: dict, mode: str, search: str) -> bool: ...
         def on_preset_changed(self, name: str) -> None: ...
         def update_presets_list(self) -> None: ...
+        def _run_next_preset(self) -> None: ...
+        def _on_multi_response(self, text: str, preset_name: str, tag: str) -> None: ...
+        def _on_multi_done(self, worker: RequestWorker) -> None: ...
 else:
     _PresetHandlingProtocol = object
 
@@ -64,26 +86,56 @@ class PresetHandlingMixin(_PresetHandlingProtocol):  # type: ignore[misc]
         json_file = preset.get("json_file", "")
         if not json_file:
             return False
-        is_unhappy = "/unhappy/" in json_file.replace("\\", "/").lower()
+        is_unhappy = is_unhappy_json_file(json_file)
         if (mode == "happy" and is_unhappy) or (mode == "unhappy" and not is_unhappy):
             return False
         return search.lower() in name.lower()
 
+    @Slot()
     def update_presets_list(self: _PresetHandlingProtocol) -> None:  # type: ignore[misc]
-        """Repopulate the preset and JSON-file combo boxes based on mode and search."""
+        """Repopulate the preset and JSON-file combo boxes based on mode and search.
+
+        Matching only scans the manager's precomputed bucket for the current
+        mode, so each keystroke costs one substring test per candidate. When
+        the new search extends the previous one within the same bucket, only
+        the previous matches are rescanned: anything containing the longer
+        string also contains its prefix. Items are then added in a single
+        ``addItems`` call per combo with signals blocked, so a rebuild costs
+        one model update instead of one ``currentTextChanged`` round-trip per
+        preset.
+        """
         search = self.preset_search.text().lower()
         mode = self.test_mode_combo.currentText().lower()
+        bucket = self.presets.by_mode.get(mode, [])
+        if bucket is self._search_bucket and search.startswith(self._last_search):
+            candidates = self._search_matches
+        else:
+            candidates = bucket
+        if search:
+            matches = [(name_lower, preset) for name_lower, preset in candidates if search in name_lower]
+        else:
+            # Everything contains the empty string; copy the bucket without testing each entry
+            matches = list(candidates)
+        self._last_search, self._search_bucket, self._search_matches = search, bucket, matches
+
+        names = [preset["name"] for _, preset in matches]
+        files = ["(none)"] + [preset["json_file"] for _, preset in matches]
+
+        self.preset_combo.blockSignals(True)
         self.preset_combo.clear()
+        self.preset_combo.addItems(names)
+        self.preset_combo.blockSignals(False)
+
+        self.json_combo.blockSignals(True)
         self.json_combo.clear()
-        self.json_combo.addItem("(none)")
-        for preset in self.presets.presets:
-            if self._preset_matches(preset, mode, search):
-                self.preset_combo.addItem(preset["name"])
-                self.json_combo.addItem(preset["json_file"])
-        if self.preset_combo.count():
-            self.preset_combo.setCurrentIndex(0)
-            self.on_preset_changed(self.preset_combo.currentText())
+        self.json_combo.addItems(files)
+        self.json_combo.blockSignals(False)
+        self.json_combo.setToolTip(self.json_combo.currentText())
+
+        if names:
+            self.on_preset_changed(names[0])
 
+    @Slot(str)
     def on_preset_changed(self: _PresetHandlingProtocol, name: str) -> None:  # type: ignore[misc]
         """Sync the JSON-file combo box when the selected preset changes.
 
@@ -92,13 +144,19 @@ class PresetHandlingMixin(_PresetHandlingProtocol):  # type: ignore[misc]
         preset = self.presets.get_by_name(name)
         if not preset:
             return
-        self.json_combo.clear()
-        self.json_combo.addItem("(none)")
+        items = ["(none)"]
         json_file = preset.get("json_file")
         if json_file and json_file != "(none)":
-            self.json_combo.addItem(json_file)
-            self.json_combo.setCurrentText(json_file)
+            items.append(json_file)
+        # Same batched rebuild as update_presets_list: one insert, no signal per step
+        self.json_combo.blockSignals(True)
+        self.json_combo.clear()
+        self.json_combo.addItems(items)
+        self.json_combo.setCurrentIndex(len(items) - 1)
+        self.json_combo.blockSignals(False)
+        self.json_combo.setToolTip(self.json_combo.currentText())
 
+    @Slot()
     def save_preset(self: _PresetHandlingProtocol) -> None:  # type: ignore[misc]
         """Prompt the user for a name and persist the current request config as a preset."""
         name, ok = QInputDialog.getText(self, "Preset Name", "Enter preset name:")
@@ -121,6 +179,7 @@ class PresetHandlingMixin(_PresetHandlingProtocol):  # type: ignore[misc]
             json_file=self.json_combo.currentText(),
         )
 
+    @Slot()
     def load_preset(self: _PresetHandlingProtocol) -> None:  # type: ignore[misc]
         """Load the currently selected preset into the request UI fields."""
         name = self.preset_combo.currentText().strip()
@@ -134,9 +193,17 @@ class PresetHandlingMixin(_PresetHandlingProtocol):  # type: ignore[misc]
             self.logger.log_preset_action("load_failed", name, reason="not_found")
             QMessageBox.warning(self, "Error", f"Preset '{name}' not found")
             return
-        self.endpoint_combo.setCurrentText(preset["endpoint"])
+        endpoint = preset["endpoint"]
+        index = self._endpoint_index.get(endpoint)
+        if index is None:
+            # Custom endpoint not in API_ENDPOINTS — add it rather than keep a stale one
+            self.endpoint_combo.addItem(endpoint)
+            index = self._endpoint_index[endpoint] = self.endpoint_combo.count() - 1
+        self.endpoint_combo.setCurrentIndex(index)
         self.json_combo.setCurrentText(preset.get("json_file", "(none)"))
-        self.json_type_combo.setCurrentText(preset.get("json_type", "normal"))
+        json_type_index = self._json_type_index.get(preset.get("json_type", "normal"))
+        if json_type_index is not None:
+            self.json_type_combo.setCurrentIndex(json_type_index)
         self.status.setText(f"Preset '{name}' loaded")
         self.logger.log_preset_action(
             "load_completed",
@@ -145,9 +212,12 @@ class PresetHandlingMixin(_PresetHandlingProtocol):  # type: ignore[misc]
             json_file=preset.get("json_file", "(none)"),
         )
 
+    @Slot()
     def run_multiple(self: _PresetHandlingProtocol) -> None:  # type: ignore[misc]
-        """Open the multi-select dialog and run selected presets sequentially."""
-        names = [self.preset_combo.itemText(i) for i in range(self.preset_combo.count())]
+        """Open the multi-select dialog and run the selected presets, a few at a time."""
+        # The combo holds exactly the last filter's matches; read them from Python
+        # rather than one itemText round-trip per entry.
+        names = [preset["name"] for _, preset in self._search_matches]
         if not names:
             QMessageBox.warning(self, "Error", "No presets available")
             return
@@ -177,48 +247,78 @@ class PresetHandlingMixin(_PresetHandlingProtocol):  # type: ignore[misc]
             QMessageBox.critical(self, "Error", f"Failed to create log file: {e}")
             return
 
+        # Batch state lives on the instance so each step is a bound-method call
+        # scheduled on the event loop rather than a chain of per-preset closures.
+        self._multi_queue = deque(dlg.selected)
+        self._multi_ip = ip
         # Read password once; each worker gets its own bytearray copy to zero independently
-        raw_password = self.pass_edit.text()
-        queue: deque[str] = deque(dlg.selected)
-
-        def run_next() -> None:
-            """Send the next queued preset, or finish when the queue is empty."""
-            if not queue:
-                self.status.setText("All presets finished")
-                return
+        self._multi_password = self.pass_edit.text()
+        self._multi_log_file = log_file
+        self._multi_total = len(dlg.selected)
+        self._multi_in_flight = 0
+        self._run_next_preset()
 
-            preset_name = queue.popleft()
-            self.current_request_count += 1
-            self._update_progress(self.current_request_count, self.total_request_count)
+    def _run_next_preset(self: _PresetHandlingProtocol) -> None:  # type: ignore[misc]
+        """Send queued batch presets up to the concurrency cap, or finish when all are done.
 
+        Up to ``_MAX_CONCURRENT_PRESETS`` requests are in flight at once, so a
+        batch takes roughly the sum of its round-trips divided by the cap
+        rather than the full sum.
+        """
+        while self._multi_queue and self._multi_in_flight < _MAX_CONCURRENT_PRESETS:
+            preset_name = self._multi_queue.popleft()
             preset = self.presets.get_by_name(preset_name)
             if not preset:
                 self.status.setText(f"Skipping invalid preset: {preset_name}")
-                QTimer.singleShot(0, run_next)
-                return
-
-            def on_response(text: str, pname: str, tag: str) -> None:
-                self.display_response(text, pname, tag)
-                self._update_progress(self.current_request_count, self.total_request_count)
-                QTimer.singleShot(0, run_next)
-
+                continue
             try:
                 worker = self.requests.send_request_async(
-                    ip,
+                    self._multi_ip,
                     self.user_edit.text(),
-                    bytearray(raw_password.encode("utf-8")),
+                    bytearray(self._multi_password.encode("utf-8")),
                     preset["endpoint"],
                     preset["json_file"],
                     self.simple_check.isChecked(),
                     preset["json_type"],
-                    on_response,
+                    self._on_multi_response,
                     preset_name=preset_name,
-                    log_file=log_file,
+                    log_file=self._multi_log_file,
+                    formatter=self._format_json_response,
                 )
-                self._track_request(worker)
-                worker.finished.connect(lambda *_: self._untrack_request(worker))
             except Exception as e:
                 self.status.setText(f"Failed to send {preset_name}: {e}")
-                QTimer.singleShot(0, run_next)
+                continue
+            self._multi_in_flight += 1
+            self._track_request(worker)
+            worker.signals.done.connect(partial(self._on_multi_done, worker))
 
-        run_next()
+        if not self._multi_queue and not self._multi_in_flight:
+            self._multi_password = ""
+            self.status.setText("All presets finished")
+
+    @Slot(str, str, str)
+    def _on_multi_response(self: _PresetHandlingProtocol, text: str, preset_name: str, tag: str) -> None:  # type: ignore[misc]
+        """Show one batch response; its slot is released by :meth:`_on_multi_done`.
+
+        :param text: Response text emitted by the worker.
+        :param preset_name: Name of the preset that produced the response.
+        :param tag: Response tag (``"ok"``, ``"warn"``, or ``"err"``).
+        """
+        self.display_response(text, preset_name, tag)
+
+    def _on_multi_done(self: _PresetHandlingProtocol, worker: RequestWorker) -> None:  # type: ignore[misc]
+        """Release *worker*'s batch slot and schedule the next preset.
+
+        Driven by ``done`` rather than ``finished``, so a worker that dies
+        without a response still frees its slot. Workers already dropped by
+        ``cancel_all_requests`` are ignored.
+
+        :param worker: The batch worker that has stopped running.
+        """
+        if worker not in self.active_requests:
+            return
+        self._untrack_request(worker)
+        self._multi_in_flight -= 1
+        completed = self._multi_total - len(self._multi_queue) - self._multi_in_flight
+        self._update_progress(completed, self._multi_total)
+        QTimer.singleShot(0, self._run_next_preset)
@@ -2,16 +2,22 @@
 from __future__ import annotations
 
 import json
-import ipaddress
+import re
+import socket
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING
 
-from PySide6.QtGui import QTextCursor
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtWidgets import (
     QCheckBox, QComboBox, QLabel, QLineEdit,
-    QMessageBox, QPushButton, QTextEdit, QWidget,
+    QMessageBox, QPlainTextEdit, QPushButton, QWidget,
 )
 
+from config.json_codec import dumps_pretty
+
 if TYPE_CHECKING:
+    from collections import deque
+
     from config.di_container import RequestManagerProtocol
     from managers.requests_manager import RequestWorker
     from config.logging_system import StructuredLogger
@@ -28,10 +34,15 @@ if TYPE_CHECKING:
         json_type_combo: QComboBox
         btn_cancel: QPushButton
         status: QLabel
-        response: QTextEdit
+        response: QPlainTextEdit
+        _response_timer: QTimer
+        _pending_responses: list[str]
         active_requests: list[RequestWorker]
         current_request_count: int
         total_request_count: int
+        _multi_queue: deque[str]
+        _multi_password: str
+        _multi_in_flight: int
         requests: RequestManagerProtocol
         logger: StructuredLogger
 
@@ -42,11 +53,74 @@ if TYPE_CHECKING:
         def _untrack_request(self, worker: RequestWorker) -> None: ...
         def display_response(self, text: str, preset_name: str, tag: str) -> None: ...
         def _format_json_response(self, text: str) -> str: ...
-        def _build_response_html(self, text: str, preset_name: str, tag: str) -> str: ...
-        def _escape_html(self, text: str) -> str: ...
+        def _build_response_text(self, text: str, preset_name: str, tag: str) -> str: ...
 else:
     _RequestHandlingProtocol = object
 
+_SEPARATOR = "\u2500" * 60
+_JSON_START = re.compile(r"[{\[]")
+_JSON_DECODER = json.JSONDecoder()
+# Documents tried before giving up: the echoed request payload, then the body.
+# A small fixed bound keeps multi-document (e.g. NDJSON) bodies linear.
+_MAX_JSON_DOCUMENTS = 3
+# Longer responses are formatted without the cache, which would otherwise keep
+# up to _prettify's maxsize multi-megabyte texts alive for the whole session
+_PRETTIFY_CACHE_MAX_CHARS = 64 * 1024
+
+
+@lru_cache(maxsize=32)
+def _is_valid_ip(ip: str) -> bool:
+    """Return True if *ip* parses as an IPv4 or IPv6 address.
+
+    Uses the C-level ``inet_pton`` rather than building an ``ipaddress``
+    object just to discard it. Cached, as the same device IP is checked on
+    every send and batch run. An IPv6 address may carry a ``%scope`` suffix
+    (e.g. ``fe80::1%eth0``), as ``ipaddress`` allows.
+    """
+    address, percent, scope = ip.partition("%")
+    if percent and (not scope or "%" in scope):
+        return False
+    families = (socket.AF_INET6,) if percent else (socket.AF_INET, socket.AF_INET6)
+    for family in families:
+        try:
+            socket.inet_pton(family, address)
+            return True
+        # ValueError: inet_pton rejects embedded NUL characters this way
+        except (OSError, ValueError):
+            pass
+    return False
+
+
+@lru_cache(maxsize=256)
+def _prettify(text: str) -> str:
+    """Pretty-print the JSON portion of *text*, leaving any prefix intact.
+
+    Cached by raw text: batch runs frequently receive byte-identical bodies, and
+    unparseable input is cached too so it is not re-parsed on every repeat.
+    Callers bypass the cache for text over ``_PRETTIFY_CACHE_MAX_CHARS``.
+    Text that cannot hold a trailing JSON document — no ``{``/``[`` at all, or
+    not ending in ``}``/``]`` (e.g. a plain ``OK`` body) — is returned without
+    attempting a parse. Complete documents ahead of the trailing one, such as
+    the echoed request payload, are skipped and left as they are, up to
+    ``_MAX_JSON_DOCUMENTS`` in all; past that the text is returned unchanged.
+    """
+    match = _JSON_START.search(text)
+    stripped_len = len(text.rstrip())
+    if match is None or text[stripped_len - 1:stripped_len] not in ("}", "]"):
+        return text
+    for _ in range(_MAX_JSON_DOCUMENTS):
+        idx = match.start()
+        try:
+            obj, end = _JSON_DECODER.raw_decode(text, idx)
+        except Exception:
+            return text
+        if end == stripped_len:
+            return text[:idx] + dumps_pretty(obj)
+        match = _JSON_START.search(text, end)
+        if match is None:
+            return text
+    return text
+
 
 class RequestHandlingMixin(_RequestHandlingProtocol):  # type: ignore[misc]
     """Mixin that handles sending, cancelling, and displaying HTTP requests."""
@@ -54,12 +128,9 @@ class RequestHandlingMixin(_RequestHandlingProtocol):  # type: ignore[misc]
     @staticmethod
     def _validate_ip(ip: str) -> bool:
         """Return True if *ip* is a valid IPv4 or IPv6 address."""
-        try:
-            ipaddress.ip_address(ip)
-            return True
-        except ValueError:
-            return False
+        return _is_valid_ip(ip)
 
+    @Slot()
     def send_request(self: _RequestHandlingProtocol) -> None:  # type: ignore[misc]
         """Validate inputs and fire a single async HTTP request."""
         ip = self.ip_edit.text().strip()
@@ -112,23 +183,28 @@ class RequestHandlingMixin(_RequestHandlingProtocol):  # type: ignore[misc]
                 self.json_type_combo.currentText(),
                 on_response,
                 preset_name=self.endpoint_combo.currentText(),
+                formatter=self._format_json_response,
             )
             self._track_request(worker)
-            worker.finished.connect(lambda *_: self._untrack_request(worker))
+            worker.signals.done.connect(partial(self._untrack_request, worker))
 
         except Exception as e:
             self.logger.exception("Failed to send request", ip=ip, endpoint=endpoint)
             QMessageBox.critical(self, "Error", f"Failed to send request: {e}")
             self.status.setText("Request failed")
 
+    @Slot()
     def cancel_all_requests(self: _RequestHandlingProtocol) -> None:  # type: ignore[misc]
-        """Terminate all in-flight request workers immediately."""
+        """Cancel all in-flight request workers; their responses are discarded."""
         if not self.active_requests:
             return
         for worker in self.active_requests:
-            worker.terminate()
-            worker.wait()
+            worker.cancel()
         self.active_requests.clear()
+        # Stop any batch run too, dropping its cached password
+        self._multi_queue.clear()
+        self._multi_password = ""
+        self._multi_in_flight = 0
         self.current_request_count = 0
         self.total_request_count = 0
         self.btn_cancel.setEnabled(False)
@@ -155,55 +231,55 @@ class RequestHandlingMixin(_RequestHandlingProtocol):  # type: ignore[misc]
         if total > 1:
             self.status.setText(f"Progress: {completed}/{total} requests")
 
-    def _format_json_response(self, text: str) -> str:
-        """Pretty-print the JSON portion of *text*, leaving any prefix intact."""
-        try:
-            if "{" in text:
-                idx = text.index("{")
-                obj = json.loads(text[idx:])
-                return text[:idx] + json.dumps(obj, indent=2, ensure_ascii=False)
-        except Exception:
-            pass
-        return text
+    @staticmethod
+    def _format_json_response(text: str) -> str:
+        """Pretty-print the JSON portion of *text*, leaving any prefix intact.
 
-    def _escape_html(self, text: str) -> str:
-        """Escape HTML special characters in *text*."""
-        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        A plain function with no widget state, so request workers can run it
+        on their own thread (see the ``formatter`` argument of
+        ``send_request_async``).
+        """
+        if len(text) > _PRETTIFY_CACHE_MAX_CHARS:
+            return _prettify.__wrapped__(text)
+        return _prettify(text)
 
-    def _build_response_html(self, text: str, preset_name: str, tag: str) -> str:
-        """Return an HTML snippet for one response entry.
+    def _build_response_text(self, text: str, preset_name: str, tag: str) -> str:
+        """Return the plain-text block for one response entry.
 
         :param text: The plain-text response body.
         :param preset_name: Name of the preset that produced this response.
         :param tag: Response tag (``"ok"``, ``"warn"``, or ``"err"``).
-        :returns: An HTML string ready for insertion into the response QTextEdit.
+        :returns: A separator line, an upper-cased header and the body, ready
+            for ``QPlainTextEdit.appendPlainText``.
         """
-        separator = '<div style="border-top: 1px solid #c0c0c0; margin: 4px 0;"></div>'
-        header_style = (
-            "font-weight: 600; color: #666666; margin-bottom: 8px; "
-            "font-size: 11px; text-transform: uppercase; letter-spacing: 0.5px;"
-        )
-        body_style = (
-            "font-family: Consolas, monospace; font-size: 12px; "
-            "line-height: 1.5; color: #333333;"
-        )
-        header = f'<div style="{header_style}">{preset_name or "Request"}</div><br>'
-        body = self._escape_html(text).replace("\n", "<br>")
-        return f'{separator}<div style="{body_style}">{header}{body}</div>'
+        header = (preset_name or "Request").upper()
+        return f"{_SEPARATOR}\n{header}\n\n{text}"
 
+    @Slot(str, str, str)
     def display_response(self: _RequestHandlingProtocol, text: str, preset_name: str, tag: str) -> None:  # type: ignore[misc]
-        """Format and append *text* to the response viewer.
+        """Queue *text* for the response viewer.
+
+        Entries are appended by :meth:`_flush_responses` shortly after the
+        first one arrives, so responses landing together share one append.
 
-        :param text: Raw response text returned by the request worker.
+        :param text: Response text, already formatted on the worker thread.
         :param preset_name: Preset name shown as the entry header.
         :param tag: Response tag used for colouring/logging.
         """
-        formatted = self._format_json_response(text)
-        html = self._build_response_html(formatted, preset_name, tag)
-        self.response.moveCursor(QTextCursor.MoveOperation.End)
-        self.response.insertHtml(html)
-        self.response.moveCursor(QTextCursor.MoveOperation.End)
+        self._pending_responses.append(self._build_response_text(text, preset_name, tag))
+        if not self._response_timer.isActive():
+            self._response_timer.start()
+
+    @Slot()
+    def _flush_responses(self: _RequestHandlingProtocol) -> None:  # type: ignore[misc]
+        """Append all queued response entries to the viewer in one call."""
+        if self._pending_responses:
+            self.response.appendPlainText("\n".join(self._pending_responses))
+            self._pending_responses.clear()
 
+    @Slot()
     def clear_response(self: _RequestHandlingProtocol) -> None:  # type: ignore[misc]
-        """Clear all content from the response viewer."""
+        """Clear all content from the response viewer, including queued entries."""
+        self._response_timer.stop()
+        self._pending_responses.clear()
         self.response.clear()
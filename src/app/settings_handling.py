@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QByteArray, QTimer, Slot
 from PySide6.QtWidgets import QCheckBox, QComboBox, QLineEdit, QWidget
 
 if TYPE_CHECKING:
@@ -21,9 +21,13 @@ if TYPE_CHECKING:
         endpoint_combo: QComboBox
         json_combo: QComboBox
         settings: SettingsManagerProtocol
+        _settings_timer: QTimer
 else:
     _SettingsHandlingProtocol = object
 
+# Quiet period after the last edit before auto-saved settings are written to disk
+_SETTINGS_SAVE_DELAY_MS = 500
+
 
 class SettingsHandlingMixin(_SettingsHandlingProtocol):  # type: ignore[misc]
     """Mixin that loads, saves, and auto-saves application settings."""
@@ -43,8 +47,12 @@ class SettingsHandlingMixin(_SettingsHandlingProtocol):  # type: ignore[misc]
                 self.endpoint_combo.setCurrentIndex(index)
 
         geometry = self.settings.get_window_geometry()
-        if geometry:
-            self.restoreGeometry(bytes.fromhex(geometry))
+        if geometry and not self.restoreGeometry(QByteArray.fromBase64(geometry.encode("ascii"))):
+            # Settings files written before the switch to base64 hold hex
+            try:
+                self.restoreGeometry(bytes.fromhex(geometry))
+            except ValueError:
+                pass
 
     def save_settings(self: _SettingsHandlingProtocol) -> None:  # type: ignore[misc]
         """Collect all current UI values and persist them to disk."""
@@ -55,24 +63,48 @@ class SettingsHandlingMixin(_SettingsHandlingProtocol):  # type: ignore[misc]
         self.settings.set_last_json_type(self.json_type_combo.currentText())
         self.settings.set_last_endpoint(self.endpoint_combo.currentText())
         self.settings.set_last_json_file(self.json_combo.currentText())
-        geometry = self.saveGeometry().data().hex()
+        geometry = self.saveGeometry().toBase64().data().decode("ascii")
         self.settings.set_window_geometry(geometry)
+        # Everything is written now, so a pending auto-save has nothing left to do
+        self._settings_timer.stop()
+        self.settings.save_settings()
+
+    def _setup_settings_auto_save(self) -> None:
+        """Create the single-shot timer that coalesces auto-saves into one write.
+
+        Must run before the widgets are populated, as that fires the
+        auto-save handlers.
+        """
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(_SETTINGS_SAVE_DELAY_MS)
+        self._settings_timer.timeout.connect(self._flush_settings)
+
+    @Slot()
+    def _flush_settings(self: _SettingsHandlingProtocol) -> None:  # type: ignore[misc]
+        """Write the auto-saved settings to disk."""
         self.settings.save_settings()
 
+    @Slot()
     def _auto_save_connection_settings(self: _SettingsHandlingProtocol) -> None:  # type: ignore[misc]
-        """Persist connection-related fields whenever they change."""
+        """Record connection-related fields and schedule a save.
+
+        Typing an IP fires this per keystroke; the restartable timer turns
+        the burst into a single write.
+        """
         self.settings.set_last_ip(self.ip_edit.text())
         self.settings.set_last_user(self.user_edit.text())
         self.settings.set_last_simple_format(self.simple_check.isChecked())
-        self.settings.save_settings()
+        self._settings_timer.start()
 
+    @Slot()
     def _auto_save_ui_settings(self: _SettingsHandlingProtocol) -> None:  # type: ignore[misc]
-        """Persist UI-state fields whenever they change."""
+        """Record UI-state fields and schedule a save."""
         self.settings.set_last_test_mode(self.test_mode_combo.currentText())
         self.settings.set_last_json_type(self.json_type_combo.currentText())
         self.settings.set_last_endpoint(self.endpoint_combo.currentText())
         self.settings.set_last_json_file(self.json_combo.currentText())
-        self.settings.save_settings()
+        self._settings_timer.start()
 
     def _setup_geometry_auto_save(self) -> None:
         """Create a single-shot timer used to debounce geometry saves."""
@@ -80,8 +112,9 @@ class SettingsHandlingMixin(_SettingsHandlingProtocol):  # type: ignore[misc]
         self._geometry_timer.setSingleShot(True)
         self._geometry_timer.timeout.connect(self._auto_save_geometry)
 
+    @Slot()
     def _auto_save_geometry(self: _SettingsHandlingProtocol) -> None:  # type: ignore[misc]
         """Write the current window geometry to settings."""
-        geometry = self.saveGeometry().data().hex()
+        geometry = self.saveGeometry().toBase64().data().decode("ascii")
         self.settings.set_window_geometry(geometry)
         self.settings.save_settings()
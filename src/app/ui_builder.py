@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import itertools
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import (
     QApplication,
@@ -14,7 +15,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QCheckBox,
-    QTextEdit,
+    QPlainTextEdit,
     QLabel,
     QWidget,
     QSizePolicy,
@@ -38,6 +39,20 @@ BTN_HVR = "#F0F0F2"
 INPUT_BG = "#FFFFFF"
 DANGER = "#DC2626"
 
+# Each line of the response log is one block; older lines are dropped once the
+# cap is reached so long batch runs keep constant append cost and bounded memory.
+_RESPONSE_MAX_BLOCKS = 20_000
+
+# Quiet period after the last keystroke in the preset search box before the
+# preset list is rebuilt, so typing a name triggers one rebuild, not one per key.
+_SEARCH_DEBOUNCE_MS = 120
+
+# Responses arriving within this window of the first one are appended together,
+# so a burst of batch results costs one layout and repaint instead of one each.
+_RESPONSE_FLUSH_MS = 50
+
+_JSON_TYPES = ("normal", "google", "rpc")
+
 _GLOBAL_QSS = f"""
 QWidget {{
     background-color: {BG}; color: {TEXT_PRIMARY};
@@ -88,7 +103,7 @@ QCheckBox::indicator:checked {{
     background-color: {ACCENT}; border-color: {ACCENT};
     image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTAiIGhlaWdodD0iOCIgdmlld0JveD0iMCAwIDEwIDgiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+PHBhdGggZD0iTTEgNEwzLjUgNi41TDkgMS41IiBzdHJva2U9IndoaXRlIiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgc3Ryb2tlbGluZWpvaW49InJvdW5kIi8+PC9zdmc+);
 }}
-QTextEdit {{
+QPlainTextEdit {{
     background-color: {CARD_BG}; border: none; padding: 16px;
     font-family: Consolas, Monaco, monospace; font-size: 12px; color: {TEXT_PRIMARY};
 }}
@@ -168,9 +183,13 @@ if TYPE_CHECKING:
         btn_multi: QPushButton
         btn_cancel: QPushButton
         btn_clear: QPushButton
-        response: QTextEdit
+        response: QPlainTextEdit
         status_label: QLabel
         status: QLabel
+        _filter_timer: QTimer
+        _response_timer: QTimer
+        _endpoint_index: dict[str, int]
+        _json_type_index: dict[str, int]
 
 
         # Cross-mixin callbacks
@@ -184,26 +203,33 @@ if TYPE_CHECKING:
         def run_multiple(self) -> None: ...
         def cancel_all_requests(self) -> None: ...
         def clear_response(self) -> None: ...
+        def _flush_responses(self) -> None: ...
 else:
     _UIBuilderProtocol = object
 
 
+@lru_cache(maxsize=None)
+def _light_palette() -> QPalette:
+    """Return the light-theme palette, built on first use."""
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window,          QColor(SIDEBAR_BG))
+    palette.setColor(QPalette.ColorRole.Base,            QColor(CARD_BG))
+    palette.setColor(QPalette.ColorRole.AlternateBase,   QColor(BG))
+    palette.setColor(QPalette.ColorRole.Text,            QColor(TEXT_PRIMARY))
+    palette.setColor(QPalette.ColorRole.WindowText,      QColor(TEXT_PRIMARY))
+    palette.setColor(QPalette.ColorRole.Button,          QColor(BTN_BG))
+    palette.setColor(QPalette.ColorRole.ButtonText,      QColor(TEXT_PRIMARY))
+    palette.setColor(QPalette.ColorRole.Highlight,       QColor(ACCENT))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
+    return palette
+
+
 class UIBuilderMixin:
     """Mixin that applies the application theme and constructs the two-panel UI."""
 
     def apply_light_theme(self: _UIBuilderProtocol) -> None:  # type: ignore[misc]
         """Set the Qt palette and global stylesheet to the light theme."""
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window,          QColor(SIDEBAR_BG))
-        palette.setColor(QPalette.ColorRole.Base,            QColor(CARD_BG))
-        palette.setColor(QPalette.ColorRole.AlternateBase,   QColor(BG))
-        palette.setColor(QPalette.ColorRole.Text,            QColor(TEXT_PRIMARY))
-        palette.setColor(QPalette.ColorRole.WindowText,      QColor(TEXT_PRIMARY))
-        palette.setColor(QPalette.ColorRole.Button,          QColor(BTN_BG))
-        palette.setColor(QPalette.ColorRole.ButtonText,      QColor(TEXT_PRIMARY))
-        palette.setColor(QPalette.ColorRole.Highlight,       QColor(ACCENT))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
-        QApplication.setPalette(palette)
+        QApplication.setPalette(_light_palette())
         self.setStyleSheet(_GLOBAL_QSS)
 
     def build_ui(self: _UIBuilderProtocol) -> None:  # type: ignore[misc]
@@ -287,7 +313,11 @@ class UIBuilderMixin:
         self.test_mode_combo.currentTextChanged.connect(self._auto_save_ui_settings)
         self.preset_search = QLineEdit()
         self.preset_search.setPlaceholderText("Search presets…")
-        self.preset_search.textChanged.connect(self.update_presets_list)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.update_presets_list)
+        self.preset_search.textChanged.connect(lambda _: self._filter_timer.start())
         filter_row.addWidget(self.test_mode_combo)
         filter_row.addWidget(self.preset_search, 1)
         preset_lay.addLayout(filter_row)
@@ -318,8 +348,11 @@ class UIBuilderMixin:
         self.endpoint_combo = QComboBox()
         self.endpoint_combo.addItems(API_ENDPOINTS)
         self.endpoint_combo.currentTextChanged.connect(self._auto_save_ui_settings)
+        # text → row maps so load_preset can select without a findText scan
+        self._endpoint_index = {e: i for i, e in enumerate(API_ENDPOINTS)}
         self.json_type_combo = QComboBox()
-        self.json_type_combo.addItems(["normal", "google", "rpc"])
+        self.json_type_combo.addItems(_JSON_TYPES)
+        self._json_type_index = {t: i for i, t in enumerate(_JSON_TYPES)}
         self.json_type_combo.setFixedWidth(90)
         self.json_type_combo.currentTextChanged.connect(self._auto_save_ui_settings)
         endpoint_row.addWidget(self.endpoint_combo, 1)
@@ -412,12 +445,17 @@ class UIBuilderMixin:
         tb_layout.addWidget(self.btn_clear)
         right_layout.addWidget(toolbar)
 
-        self.response = QTextEdit(readOnly=True)
-        self.response.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.response = QPlainTextEdit(readOnly=True)
+        self.response.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.response.setMaximumBlockCount(_RESPONSE_MAX_BLOCKS)
         self.response.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
         right_layout.addWidget(self.response, 1)
+        self._response_timer = QTimer(self)
+        self._response_timer.setSingleShot(True)
+        self._response_timer.setInterval(_RESPONSE_FLUSH_MS)
+        self._response_timer.timeout.connect(self._flush_responses)
 
         splitter.addWidget(right)
         splitter.setSizes([340, 860])
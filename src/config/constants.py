@@ -5,17 +5,20 @@ from typing import Final
 
 # ================= Resource Paths =================
 
+# Resolved once: whether we run frozen, and from where, cannot change at runtime.
+_BASE_DIR: Final[Path] = (
+    Path(sys.executable).parent
+    if getattr(sys, "frozen", False)
+    else Path(__file__).resolve().parent.parent  # src/
+)
+
+
 def resource_path(relative_path: str) -> Path:
     """
     Return absolute path to a resource (JSON, presets, logs).
     Works for both Python scripts and frozen executables.
     """
-    base_dir = (
-        Path(sys.executable).parent
-        if getattr(sys, "frozen", False)
-        else Path(__file__).resolve().parent.parent  # src/
-    )
-    return base_dir / relative_path
+    return _BASE_DIR / relative_path
 
 
 # ================= Folders & Files =================
@@ -25,34 +28,11 @@ LOGS_FOLDER: Final[Path] = resource_path("logs")
 PRESETS_FILE: Final[Path] = resource_path("config/presets.json")
 
 
-# ================= Theme Colors =================
-
-class LightTheme:
-    BG: Final[str] = "#f0f0f0"
-    ENTRY_BG: Final[str] = "#ffffff"
-    TEXT_COLOR: Final[str] = "#000000"
-    BTN_ACTIVE: Final[str] = "#d0d0d0"
-    STATUS_BG: Final[str] = "#e0e0e0"
-
-
-# ================= API Modes =================
-
-JSON_TYPES: Final[list[str]] = [
-    "Normal JSON",
-    "Google JSON",
-    "JSON-RPC",
-]
-
-METHOD_IN_OPTIONS: Final[list[str]] = [
-    "Method in Path",
-    "Method in Action",
-    "Method in JSON Body",
-]
-
-
 # ================= API Endpoints =================
 
-API_ENDPOINTS: Final[list[str]] = [
+# Immutable, and interned so equality checks against these values (combo-box
+# lookups, preset endpoint fields) can short-circuit on identity.
+API_ENDPOINTS: Final[tuple[str, ...]] = tuple(map(sys.intern, (
     # -------- Base --------
     "/api/call",
     "/api/intercom/",
@@ -89,4 +69,4 @@ API_ENDPOINTS: Final[list[str]] = [
     "/api/call/Call",
     "/api/call/GetCallStatus",
     "/api/call/TerminateCall",
-]
+)))
@@ -12,6 +12,7 @@ class PresetManagerProtocol(Protocol):
     """Structural interface for preset managers."""
 
     presets: list[dict[str, Any]]
+    by_mode: dict[str, list[tuple[str, dict[str, Any]]]]
 
     def load_presets(self) -> list[dict[str, Any]]: ...
     def save_presets(self, presets: list[dict[str, Any]]) -> None: ...
@@ -36,6 +37,7 @@ class RequestManagerProtocol(Protocol):
         callback: Callable[..., Any],
         preset_name: str = "",
         log_file: Path | None = None,
+        formatter: Callable[[str], str] | None = None,
     ) -> Any: ...
 
     def build_request(
@@ -0,0 +1,91 @@
+"""JSON encode/decode helpers for API Test Tool.
+
+Uses `orjson <https://github.com/ijl/orjson>`_ when it is installed and falls
+back to the standard library otherwise, so the app never *requires* it.
+:func:`loads` and :func:`dumps_pretty` give the same result either way —
+two-space indentation, non-ASCII characters written as-is. Where orjson
+would lose information or render a value differently (non-finite floats
+written as ``null``, integers beyond 64 bits parsed as floats, ``1e16``
+for ``1e+16``) the standard library handles the call instead. Compact
+:func:`dumps` output holds the same values but may spell floats differently.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+# orjson parses integers outside [-2**63, 2**64) as floats. Any run of this
+# many digits might be one, so such documents go to the stdlib parser.
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+# A float value in OPT_INDENT_2 output: after a key or alone on an array line,
+# so string contents never match. orjson spells some floats unlike the stdlib
+# (1e16 vs 1e+16, 0.00001 vs 1e-05), so those documents are pretty-printed there.
+_FLOAT_VALUE = re.compile(rb"(?:: |^ *)-?\d+(?:\.\d+(?:[eE][-+]?\d+)?|[eE][-+]?\d+),?$", re.MULTILINE)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse *data* as JSON.
+
+    Falls back to :func:`json.loads` for input orjson rejects but the standard
+    library accepts (e.g. ``NaN``/``Infinity`` literals), and uses the standard
+    library outright for numbers long enough to exceed 64 bits.
+
+    :param data: JSON document as text or UTF-8 bytes.
+    :returns: The decoded Python object.
+    :raises ValueError: If *data* is not valid JSON.
+    """
+    if _orjson is not None:
+        long_digits = _LONG_DIGITS_BYTES if isinstance(data, bytes) else _LONG_DIGITS
+        if long_digits.search(data) is None:
+            try:
+                return _orjson.loads(data)
+            except _orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialise *obj* with two-space indentation.
+
+    :param obj: A JSON-serialisable object.
+    :returns: The indented JSON text, exactly as :func:`json.dumps` would
+        write it (e.g. ``NaN``/``Infinity``, ``1e+16``).
+    """
+    if _orjson is not None:
+        try:
+            data = _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            # As in dumps(): a null may stand for a non-finite float.
+            if b"null" not in data and _FLOAT_VALUE.search(data) is None:
+                return data.decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialise *obj* as compact UTF-8 JSON, e.g. for a request body.
+
+    :param obj: A JSON-serialisable object.
+    :returns: The encoded document.
+    :raises ValueError: If *obj* contains ``NaN`` or ``±Infinity``, which JSON
+        cannot represent.
+    """
+    if _orjson is not None:
+        try:
+            data = _orjson.dumps(obj)
+        except TypeError:
+            pass
+        else:
+            # orjson writes non-finite floats as null; only then is the strict
+            # stdlib pass below needed to tell them apart from real nulls.
+            if b"null" not in data:
+                return data
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import json
+import math
+import os
 import random
 import secrets
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional; the stdlib encoder is used without it
+    _orjson = None
 
 # ---------------- Configuration ----------------
 # Paths are relative to this file's location (src/config/)
@@ -16,6 +24,13 @@ ID_RPC = "helmut"
 GOOGLE_CONTEXT = "test12345"
 API_BASE_PATH = "/api"
 
+# Stdlib encoder shared by encode_payload() (used when orjson can't be), and the
+# 1 MiB buffer _write_text() writes payload files through.
+# Payload files are only read back by the app (which pretty-prints the payload
+# it sends), so they are written compact.
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_WRITE_BUFFER = 1 << 20
+
 # Test generation summary tracking
 summary: dict[str, int] = {
     "normal": 0,
@@ -25,34 +40,84 @@ summary: dict[str, int] = {
     "unhappy_fuzz": 0,
 }
 
+# Payload files queued by the preset builders and written by flush_writes()
+pending_writes: list[tuple[Path, Any]] = []
+
+# Shared (never mutated) params for endpoints that take none, so their payload
+# files are serialised once by flush_writes()
+_NO_PARAMS: dict[str, Any] = {}
+
 # ---------------- Utility Functions ----------------
 def generate_uuid_list(count: int = 1) -> list[str]:
-    """Generate a list of UUID strings."""
-    return [str(uuid.uuid4()) for _ in range(count)]
+    """Generate a list of random (version 4) UUID strings.
+
+    Reads the entropy for all of them with a single ``os.urandom`` call.
+    """
+    buf = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Return True if *data* contains an ``inf``/``nan`` float anywhere."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(v) for v in data.values())
+    if isinstance(data, list):
+        return any(_has_non_finite(v) for v in data)
+    return False
+
 
+def encode_payload(payload: Any) -> str:
+    """Serialise *payload* as compact JSON, with orjson when it is installed.
 
-def save_json(path: Path, payload: Any) -> None:
-    """Save payload to JSON file with proper directory creation."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    orjson writes non-finite floats as ``null``, so fuzz payloads carrying
+    ``inf`` go through the stdlib encoder to keep their ``Infinity`` values.
+    """
+    if _orjson is not None and not _has_non_finite(payload):
+        return _orjson.dumps(payload).decode("utf-8")
+    return _ENCODER.encode(payload)
+
+
+def _write_text(path: Path, text: str) -> None:
+    """Write already-serialised JSON *text* to *path*."""
+    with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+        f.write(text)
+
+
+def flush_writes() -> None:
+    """Write every queued payload file concurrently, then clear the queue.
+
+    Each distinct payload object is serialised once, however many files it
+    is queued for (e.g. the Normal_Path and Normal_Action variants share
+    their params). Each file is then a small, independent write, so threads
+    keep the OS busy instead of waiting on one open/write/close round-trip
+    at a time.
+    """
+    # Keyed by id(): every payload stays alive in pending_writes until the end
+    encoded: dict[int, str] = {}
+    jobs: list[tuple[Path, str]] = []
+    for path, payload in pending_writes:
+        text = encoded.get(id(payload))
+        if text is None:
+            text = encoded[id(payload)] = encode_payload(payload)
+        jobs.append((path, text))
+
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() so an exception in any write is re-raised here
+        list(executor.map(lambda job: _write_text(*job), jobs))
+    pending_writes.clear()
 
 
 def get_method_from_endpoint(endpoint: str) -> str:
     """Extract method name from endpoint URL."""
-    return endpoint.split("/")[-1]
+    return endpoint.rpartition("/")[2]
 
 
 def get_section_from_endpoint(endpoint: str) -> str:
     """Determine section (get/set/remove) from endpoint."""
-    if endpoint in GET_ENDPOINTS:
-        return "get"
-    elif endpoint in SET_ENDPOINTS:
-        return "set"
-    elif endpoint in REMOVE_ENDPOINTS:
-        return "remove"
-    else:
-        return "unknown"
+    return SECTION_BY_ENDPOINT.get(endpoint, "unknown")
 
 
 # ---------------- Data Generators ----------------
@@ -69,7 +134,7 @@ def generate_random_sip_account() -> dict[str, Any]:
 def generate_random_contact() -> dict[str, Any]:
     """Generate a random contact payload."""
     first_name = f"Tester {random.randint(1, 99):02d}"
-    contact_id = str(uuid.uuid4())
+    contact_id = generate_uuid_list()[0]
     sip_address = f"192168{random.randint(1000, 9999)}"
     sip_account_id = f"sip_account_{random.randint(0, 9)}"
     return {
@@ -116,6 +181,13 @@ REMOVE_ENDPOINTS = [
     "/api/intercom/RemoveContacts",
 ]
 
+# One hash lookup per endpoint instead of scanning the three lists in turn
+SECTION_BY_ENDPOINT: dict[str, str] = {
+    endpoint: section
+    for section, endpoints in (("get", GET_ENDPOINTS), ("set", SET_ENDPOINTS), ("remove", REMOVE_ENDPOINTS))
+    for endpoint in endpoints
+}
+
 SPECIAL_PARAMS: dict[str, dict[str, Any]] = {
     "GetSIPAccountStatus": {"SIPAccountId": "sip_account_0"},
     "GetSIPAccount": {"SIPAccountId": "sip_account_0"},
@@ -140,63 +212,64 @@ SET_PAYLOADS: dict[str, Any] = {
 
 
 # ---------------- Test Data Generators ----------------
-def create_unhappy_payload(data: Any) -> Any:
-    """Create payload with empty/null values for testing unhappy path."""
-    if isinstance(data, dict):
-        return {k: create_unhappy_payload(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return []
-    if isinstance(data, str):
-        return ""
-    if isinstance(data, (int, float)):
-        return -1
-    return None
+# Each handler returns the (no_data, invalid, wrong_type, fuzz) variants of one
+# value, so a payload tree is walked once for all four unhappy test types.
+_FUZZ_STRINGS = ("A" * 5000, "<script>alert(1)</script>", "' OR 1=1 --", "\x00\x01\x02", "漢字🚀")
+_FUZZ_NUMBERS = (0, -1, 999999999999999999, float("inf"), float("-inf"))
 
+Variants = tuple[Any, Any, Any, Any]
 
-def create_invalid_payload(data: Any) -> Any:
-    """Create payload with invalid values for testing error handling."""
-    if isinstance(data, dict):
-        return {k: create_invalid_payload(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return ["INVALID"]
-    if isinstance(data, str):
-        return "INVALID"
-    if isinstance(data, (int, float)):
-        return -999
-    return "INVALID"
 
+def _dict_variants(data: dict[str, Any]) -> Variants:
+    """Build all four variants of a dict by walking its items once."""
+    no_data: dict[str, Any] = {}
+    invalid: dict[str, Any] = {}
+    wrong_type: dict[str, Any] = {}
+    fuzz: dict[str, Any] = {}
+    for key, value in data.items():
+        no_data[key], invalid[key], wrong_type[key], fuzz[key] = make_all_variants(value)
+    return no_data, invalid, wrong_type, fuzz
 
-def create_wrong_type_payload(data: Any) -> Any:
-    """Create payload with wrong data types for testing validation."""
-    if isinstance(data, dict):
-        return {k: create_wrong_type_payload(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return "WRONG_TYPE"
-    if isinstance(data, str):
-        return 12345
-    if isinstance(data, (int, float)):
-        return "NOT_A_NUMBER"
-    if isinstance(data, bool):
-        return "true"
-    return None
 
+def _list_variants(data: list[Any]) -> Variants:
+    """Build all four variants of a list (fuzz keeps the first item's shape)."""
+    fuzz = [make_all_variants(data[0])[3]] if data else [None]
+    return [], ["INVALID"], "WRONG_TYPE", fuzz
 
-def create_fuzz_payload(data: Any) -> Any:
-    """Create payload with fuzz testing values."""
-    fuzz_strings = ["A" * 5000, "<script>alert(1)</script>", "' OR 1=1 --", "\x00\x01\x02", "漢字🚀"]
-    fuzz_numbers = [0, -1, 999999999999999999, float("inf"), float("-inf")]
 
-    if isinstance(data, dict):
-        return {k: create_fuzz_payload(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return [create_fuzz_payload(data[0])] if data else [None]
-    if isinstance(data, str):
-        return random.choice(fuzz_strings)
-    if isinstance(data, (int, float)):
-        return random.choice(fuzz_numbers)
-    if isinstance(data, bool):
-        return "TRUEEEEE"
-    return None
+def _str_variants(data: str) -> Variants:
+    """Build all four variants of a string value."""
+    return "", "INVALID", 12345, random.choice(_FUZZ_STRINGS)
+
+
+def _number_variants(data: float) -> Variants:
+    """Build all four variants of a numeric (or bool) value."""
+    return -1, -999, "NOT_A_NUMBER", random.choice(_FUZZ_NUMBERS)
+
+
+# bool is an int subclass and has always been treated as a number here
+_VARIANT_HANDLERS: dict[type, Callable[[Any], Variants]] = {
+    dict: _dict_variants,
+    list: _list_variants,
+    str: _str_variants,
+    bool: _number_variants,
+    int: _number_variants,
+    float: _number_variants,
+}
+
+
+def make_all_variants(data: Any) -> Variants:
+    """Create the no-data, invalid, wrong-type and fuzz payloads in one pass.
+
+    - no data: empty/null values
+    - invalid: ``"INVALID"`` / ``-999`` values
+    - wrong type: strings where numbers are expected and vice versa
+    - fuzz: XSS, SQL injection, overflow and unicode edge-case values
+    """
+    handler = _VARIANT_HANDLERS.get(type(data))
+    if handler is None:
+        return None, "INVALID", None, None
+    return handler(data)
 
 
 # ---------------- Directory Setup ----------------
@@ -226,53 +299,49 @@ def create_normal_presets(
         "Google":        "google",
         "RPC":           "rpc",
     }
+    json_types = {name: "normal" if name.startswith("Normal") else name.lower() for name in formats}
+    section_folder = JSON_FOLDER / section
 
     for endpoint in endpoints:
-        method = get_method_from_endpoint(endpoint)
-        params = payloads.get(method, {})
+        endpoint_prefix, _, method = endpoint.rpartition("/")
+        params = payloads.get(method, _NO_PARAMS)
+        endpoint_urls = {
+            "Normal_Path":   endpoint,
+            "Normal_Action": f"{endpoint}?action={method}",
+            "Normal_Body":   endpoint_prefix,
+            "Google":        endpoint_prefix,
+            "RPC":           endpoint_prefix,
+        }
+        format_payloads = {
+            "Normal_Path":   params,
+            "Normal_Action": params,
+            "Normal_Body":   {method: params},
+            "Google": {
+                "apiVersion": "1.5",
+                "method": method,
+                "params": params,
+                "context": GOOGLE_CONTEXT,
+            },
+            "RPC": {
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params,
+                "id": ID_RPC,
+            },
+        }
 
         for format_name, subfolder in formats.items():
             file_name = f"{method}_{format_name}.json"
-            file_path = JSON_FOLDER / section / subfolder / file_name
-            # as_posix() gives forward slashes on all platforms
-            json_file_relative = file_path.relative_to(JSON_FOLDER).as_posix()
-
-            if format_name == "Normal_Body":
-                payload = {method: params}
-            elif format_name == "Google":
-                payload = {
-                    "apiVersion": "1.5",
-                    "method": method,
-                    "params": params,
-                    "context": GOOGLE_CONTEXT,
-                }
-            elif format_name == "RPC":
-                payload = {
-                    "jsonrpc": "2.0",
-                    "method": method,
-                    "params": params,
-                    "id": ID_RPC,
-                }
-            else:
-                payload = params
-
-            save_json(file_path, payload)
-
-            if format_name == "Normal_Action":
-                endpoint_url = f"{endpoint}?action={method}"
-            elif format_name == "Normal_Path":
-                endpoint_url = endpoint
-            else:
-                endpoint_url = "/".join(endpoint.split("/")[:-1])
-
+            pending_writes.append((section_folder / subfolder / file_name, format_payloads[format_name]))
             summary["normal"] += 1
 
             presets.append({
                 "name": f"{method}_{format_name}",
-                "endpoint": endpoint_url,
-                "json_file": json_file_relative,
+                "endpoint": endpoint_urls[format_name],
+                # Built directly rather than via relative_to() — always forward slashes
+                "json_file": f"{section}/{subfolder}/{file_name}",
                 "simple_format": False,
-                "json_type": "normal" if format_name.startswith("Normal") else format_name.lower(),
+                "json_type": json_types[format_name],
             })
 
     return presets
@@ -284,11 +353,12 @@ def create_unhappy_tests(
 ) -> list[dict[str, Any]]:
     """Create unhappy path test presets for error testing."""
     unhappy_presets = []
+    # Order matches the tuple returned by make_all_variants()
     test_types = [
-        ("no_data",      create_unhappy_payload,    "unhappy_no_data"),
-        ("invalid_data", create_invalid_payload,    "unhappy_invalid"),
-        ("wrong_type",   create_wrong_type_payload, "unhappy_wrong_type"),
-        ("fuzz",         create_fuzz_payload,       "unhappy_fuzz"),
+        ("no_data",      "unhappy_no_data"),
+        ("invalid_data", "unhappy_invalid"),
+        ("wrong_type",   "unhappy_wrong_type"),
+        ("fuzz",         "unhappy_fuzz"),
     ]
 
     for endpoint in endpoints:
@@ -300,16 +370,15 @@ def create_unhappy_tests(
         section = get_section_from_endpoint(endpoint)
         folder = JSON_FOLDER / section / "unhappy"
 
-        for test_suffix, payload_generator, summary_key in test_types:
-            test_payload = payload_generator(params)
+        variants = make_all_variants(params)
+        for (test_suffix, summary_key), test_payload in zip(test_types, variants):
             file_name = f"{method}_unhappy_{test_suffix}.json"
-            file_path = folder / file_name
-            save_json(file_path, test_payload)
+            pending_writes.append((folder / file_name, test_payload))
 
             unhappy_presets.append({
                 "name": f"{method}_unhappy_{test_suffix}",
                 "endpoint": endpoint,
-                "json_file": file_path.relative_to(JSON_FOLDER).as_posix(),
+                "json_file": f"{section}/unhappy/{file_name}",
                 "simple_format": False,
                 "json_type": "normal",
             })
@@ -339,8 +408,13 @@ def main() -> None:
     all_presets += create_unhappy_tests(all_endpoints, all_payloads)
     print("🔧 Unhappy test presets generated")
 
-    with PRESETS_FILE.open("w", encoding="utf-8") as f:
-        json.dump(all_presets, f, indent=2)
+    flush_writes()
+    print("📝 Payload files written")
+
+    # One preset per line: each fragment goes through the C encoder, which an
+    # indented dump of the whole list would bypass, and the file stays readable
+    fragments = [json.dumps(preset, ensure_ascii=False) for preset in all_presets]
+    _write_text(PRESETS_FILE, "[\n  " + ",\n  ".join(fragments) + "\n]\n")
     print(f"💾 Presets saved to {PRESETS_FILE}")
 
     total_tests = sum(summary.values())
@@ -6,12 +6,15 @@ from PySide6.QtWidgets import QApplication
 from app import ApiTestApp
 from config.di_container import get_container
 
+_WINDOW_BG = QColor(245, 245, 245)
+_BASE_BG = QColor(255, 255, 255)
+
 
 def create_light_palette() -> QPalette:
     """Return a simple optional light palette."""
     palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(245, 245, 245))
-    palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Window, _WINDOW_BG)
+    palette.setColor(QPalette.ColorRole.Base, _BASE_BG)
     return palette
 
 
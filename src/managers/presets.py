@@ -1,15 +1,51 @@
 """Preset manager for API Test Tool."""
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
 from typing import Any
 
 from config.constants import PRESETS_FILE
+from config.json_codec import dumps_pretty, loads
 from config.logging_system import get_logger
 
 _logger = get_logger("preset_manager")
 
+# fdatasync skips the metadata flush; Windows only has fsync (via _commit)
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def is_unhappy_json_file(json_file: str) -> bool:
+    """Return True if *json_file* lives in an ``unhappy/`` payload folder.
+
+    :param json_file: Payload path relative to ``JSON_FOLDER``; either slash style.
+    """
+    return "/unhappy/" in json_file.replace("\\", "/").lower()
+
+
+def _mode_of(preset: dict[str, Any]) -> str | None:
+    """Return the test mode *preset* belongs to, or ``None`` if it has no ``json_file``."""
+    json_file = preset.get("json_file")
+    if not json_file:
+        return None
+    return "unhappy" if is_unhappy_json_file(json_file) else "happy"
+
+
+def bucket_by_mode(presets: list[dict[str, Any]]) -> dict[str, list[tuple[str, dict[str, Any]]]]:
+    """Group *presets* into ``"happy"``/``"unhappy"`` lists of ``(name_lower, preset)``.
+
+    Presets without a ``json_file`` are left out, as they never match a mode.
+
+    :param presets: Preset dicts to group.
+    :returns: Mapping of test mode to its matching presets, in input order.
+    """
+    by_mode: dict[str, list[tuple[str, dict[str, Any]]]] = {"happy": [], "unhappy": []}
+    for p in presets:
+        mode = _mode_of(p)
+        if mode:
+            by_mode[mode].append((p.get("name", "").lower(), p))
+    return by_mode
+
 
 class PresetManager:
     """Manages loading, saving, and querying test presets from a JSON file."""
@@ -22,31 +58,57 @@ class PresetManager:
         """
         self._file = presets_file if presets_file is not None else PRESETS_FILE
         self.presets: list[dict[str, Any]] = []
+        # (lower-cased name, preset) pairs bucketed by test mode, precomputed so
+        # per-keystroke filtering only scans the active mode and does no string work.
+        self.by_mode: dict[str, list[tuple[str, dict[str, Any]]]] = bucket_by_mode([])
+        # Name → preset, so lookups from the UI and batch runner are O(1).
+        # Adding a new preset updates the indexes directly; replacing or deleting
+        # one rebuilds them, as both already rescan the list.
+        self._by_name: dict[str, dict[str, Any]] = {}
         self.load_presets()
 
+    def _rebuild_index(self) -> None:
+        """Recompute :attr:`by_mode` and the name index from :attr:`presets`."""
+        self.by_mode = bucket_by_mode(self.presets)
+        self._by_name = {}
+        for p in self.presets:
+            # setdefault keeps the first preset when a hand-edited file repeats a name
+            self._by_name.setdefault(p.get("name"), p)
+
     def load_presets(self) -> None:
         """Load presets from the JSON file into :attr:`presets`."""
         if not self._file.exists():
             self.presets = []
-            return
-        try:
-            with self._file.open("r", encoding="utf-8") as f:
-                self.presets = json.load(f)
-        except Exception as exc:
-            _logger.error("Failed to load presets", error=str(exc))
-            self.presets = []
+        else:
+            try:
+                self.presets = loads(self._file.read_bytes())
+            except Exception as exc:
+                _logger.error("Failed to load presets", error=str(exc))
+                self.presets = []
+        self._rebuild_index()
 
     def save_presets(self) -> None:
-        """Persist the current :attr:`presets` list to disk."""
+        """Persist the current :attr:`presets` list to disk.
+
+        The list is written to a temporary file that then replaces the real
+        one, so a crash mid-write leaves the previous presets intact.
+        """
+        tmp = self._file.with_name(self._file.name + ".tmp")
         try:
-            with self._file.open("w", encoding="utf-8") as f:
-                json.dump(self.presets, f, indent=2, ensure_ascii=False)
+            with tmp.open("w", encoding="utf-8") as f:
+                f.write(dumps_pretty(self.presets))
+                f.flush()
+                _fdatasync(f.fileno())
+            os.replace(tmp, self._file)
         except Exception as exc:
             _logger.error("Failed to save presets", error=str(exc))
+            tmp.unlink(missing_ok=True)
 
     def add_preset(self, preset: dict[str, Any]) -> None:
         """Add *preset* to the list, replacing any existing entry with the same name.
 
+        A replaced preset keeps its position in the list.
+
         :param preset: Preset dict; must contain a ``"name"`` key.
         """
         name = preset.get("name")
@@ -54,17 +116,34 @@ class PresetManager:
             return
         existing = self.get_by_name(name)
         if existing:
-            self.presets.remove(existing)
-        self.presets.append(preset)
+            # Assign in place: one scan to find it, and no tail shift as with remove()
+            self.presets[self.presets.index(existing)] = preset
+            self._rebuild_index()
+        else:
+            self.presets.append(preset)
+            self._index_new_preset(preset)
         self.save_presets()
 
+    def _index_new_preset(self, preset: dict[str, Any]) -> None:
+        """Add *preset*, just appended to :attr:`presets`, to the indexes.
+
+        Its mode bucket is replaced by an extended copy rather than appended to,
+        since the search filter treats an unchanged bucket object as unchanged
+        contents.
+        """
+        name = preset["name"]
+        self._by_name.setdefault(name, preset)
+        mode = _mode_of(preset)
+        if mode:
+            self.by_mode[mode] = [*self.by_mode[mode], (name.lower(), preset)]
+
     def get_by_name(self, name: str) -> dict[str, Any] | None:
         """Return the first preset whose ``"name"`` matches *name*, or ``None``.
 
         :param name: Preset name to look up.
         :returns: Matching preset dict, or ``None`` if not found.
         """
-        return next((p for p in self.presets if p.get("name") == name), None)
+        return self._by_name.get(name)
 
     def get_names(self) -> list[str]:
         """Return a list of all preset names in insertion order.
@@ -82,6 +161,7 @@ class PresetManager:
         existing = self.get_by_name(name)
         if existing:
             self.presets.remove(existing)
+            self._rebuild_index()
             self.save_presets()
             return True
         return False
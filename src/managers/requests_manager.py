@@ -2,16 +2,23 @@
 from __future__ import annotations
 
 import json
+import os
 import re
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
 from typing import Any, Callable
 
 import requests
 import urllib3
-from PySide6.QtCore import QThread, Signal
+from requests.adapters import HTTPAdapter
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 
 from config.constants import JSON_FOLDER, LOGS_FOLDER
+from config.json_codec import dumps
 from config.logging_system import get_logger
 
 LOGS_FOLDER.mkdir(parents=True, exist_ok=True)
@@ -19,6 +26,17 @@ LOGS_FOLDER.mkdir(parents=True, exist_ok=True)
 _logger = get_logger("request_manager")
 
 _FILENAME_MAX_LEN = 64
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+_PAYLOAD_CACHE_SIZE = 256
+# Hosts kept in the shared session's pool, and idle connections kept per host
+_POOL_HOSTS = 16
+_POOL_CONNECTIONS_PER_HOST = 64
+# Upper bound on requests running at once; further requests queue in the pool
+_MAX_WORKER_THREADS = 8
+# Responses longer than this are cut short in the viewer; the log keeps them whole
+_DISPLAY_MAX_CHARS = 1_000_000
+# Batch presets run concurrently and share one log file; entries must not interleave
+_LOG_LOCK = threading.Lock()
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -29,26 +47,84 @@ def make_safe_filename(name: str) -> str:
     :param name: Raw string to sanitise.
     :returns: A filesystem-safe string of at most ``_FILENAME_MAX_LEN`` characters.
     """
-    return re.sub(r"[^A-Za-z0-9._-]", "_", name)[:_FILENAME_MAX_LEN]
+    # Each character maps to exactly one, so truncating first gives the same result
+    return _UNSAFE_FILENAME_CHARS.sub("_", name[:_FILENAME_MAX_LEN])
+
+
+def _pretty_payload(payload: dict[str, Any]) -> str:
+    """Return *payload* indented for the log and response text.
+
+    Uses the stdlib encoder so fuzz payloads show ``Infinity`` exactly as sent,
+    where orjson would print ``null``.
+    """
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+@lru_cache(maxsize=_PAYLOAD_CACHE_SIZE)
+def _payload_path(root: Path, json_file: str) -> Path:
+    """Return the absolute, normalised path of *json_file* under *root*.
+
+    Either slash style is accepted. Cached, as batch runs resolve the same
+    few preset files over and over.
+
+    :param root: Payload folder, normally ``JSON_FOLDER``.
+    :param json_file: Payload path relative to *root*.
+    :raises ValueError: If the path points outside *root* (e.g. via ``..``).
+    """
+    base = Path(os.path.abspath(root))
+    path = Path(os.path.normpath(base / json_file.strip().replace("\\", "/")))
+    if not path.is_relative_to(base):
+        raise ValueError(f"Payload path is outside {base}")
+    return path
+
+
+# Shared by every request without a payload file; like cached payloads, never mutated.
+# A plain dict rather than a MappingProxyType, which requests cannot JSON-encode.
+_EMPTY_PAYLOAD: dict[str, Any] = {}
+_EMPTY_PAYLOAD_TEXT = _pretty_payload(_EMPTY_PAYLOAD)
+_EMPTY_PAYLOAD_BODY = dumps(_EMPTY_PAYLOAD)
+
+
+def _encode_body(payload: dict[str, Any]) -> bytes | None:
+    """Return *payload* encoded as a request body, or ``None`` if it can't be.
+
+    Payloads holding ``NaN``/``Infinity`` return ``None`` and are left to
+    ``requests``' own encoder, which rejects them as before.
+    """
+    try:
+        return dumps(payload)
+    except (TypeError, ValueError):
+        return None
 
 
 def _timestamp() -> str:
     """Return the current date/time formatted as ``YYYYMMDD_HHMMSS``."""
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
 
 
-# ── Worker Thread ─────────────────────────────────────────────────────────────
+# ── Worker ────────────────────────────────────────────────────────────────────
 
-class RequestWorker(QThread):
-    """QThread subclass that executes a single HTTP POST and emits the result.
+class RequestSignals(QObject):
+    """Signals for :class:`RequestWorker`, which as a ``QRunnable`` cannot own any.
 
     Signals:
         finished (str, str, str): Emitted on completion with
             ``(response_text, preset_name, tag)`` where *tag* is one of
-            ``"ok"``, ``"warn"``, or ``"err"``.
+            ``"ok"``, ``"warn"``, or ``"err"``.  When a *formatter* was given,
+            *response_text* has already been passed through it.  Not emitted
+            for a cancelled worker.
+        done: Emitted last, whether or not the worker was cancelled.
     """
 
     finished = Signal(str, str, str)  # text, preset_name, tag
+    done = Signal()
+
+
+class RequestWorker(QRunnable):
+    """Thread-pool task that executes a single HTTP POST and emits the result.
+
+    Results are delivered through :attr:`signals` (a :class:`RequestSignals`).
+    """
 
     def __init__(
         self,
@@ -61,6 +137,10 @@ class RequestWorker(QThread):
         preset_name: str = "",
         json_type: str = "normal",
         log_file: Path | None = None,
+        formatter: Callable[[str], str] | None = None,
+        session: requests.Session | None = None,
+        payload_text: str | None = None,
+        payload_body: bytes | None = None,
     ) -> None:
         """Initialise the worker with all parameters needed for the request.
 
@@ -72,8 +152,23 @@ class RequestWorker(QThread):
         :param json_type: Payload format identifier (``"normal"``, ``"google"``,
             or ``"rpc"``).
         :param log_file: Path to the log file; auto-generated when ``None``.
+        :param formatter: Optional display formatter applied to the response
+            text on this thread, so the GUI thread only has to append it.
+            The log file always receives the raw text.
+        :param session: Shared session whose connection pool keeps the device
+            connection alive between requests; a one-off connection is used
+            when ``None``.
+        :param payload_text: *payload* already pretty-printed for the log and
+            display text; serialised here when ``None``.
+        :param payload_body: *payload* already encoded as the request body;
+            ``requests`` encodes it per call when ``None``.
         """
         super().__init__()
+        # The manager holds the Python reference until ``done``; don't let the
+        # pool delete the underlying object out from under it.
+        self.setAutoDelete(False)
+        self.signals = RequestSignals()
+        self.cancelled = False
         self.url = url
         self.user = user
         self.password = password
@@ -81,26 +176,55 @@ class RequestWorker(QThread):
         self.preset_name = preset_name
         self.json_type = json_type
         self.log_file = log_file
+        self.formatter = formatter
+        self.session = session
+        self.payload_text = payload_text
+        self.payload_body = payload_body
         self.logger = get_logger("request_worker")
 
+    def cancel(self) -> None:
+        """Discard this request's result and zero the password.
+
+        A worker still queued in the pool returns without sending; one already
+        sending finishes its HTTP call but emits no ``finished`` signal.
+        """
+        self.cancelled = True
+        self.password[:] = b"\x00" * len(self.password)
+
     def run(self) -> None:
-        """Execute the HTTP request and emit the ``finished`` signal."""
+        """Send the request unless cancelled, then emit ``signals.done``."""
+        try:
+            if not self.cancelled:
+                self._send()
+        finally:
+            self.signals.done.emit()
+
+    def _send(self) -> None:
+        """Execute the HTTP request and emit ``signals.finished``."""
         self._ensure_log_file()
+        payload_text = self.payload_text
+        if payload_text is None:
+            payload_text = _pretty_payload(self.payload)
         self.logger.info(
             f"Starting request to {self.url}",
             url=self.url,
             user=self.user,
             preset_name=self.preset_name,
-            payload_size=len(json.dumps(self.payload)),
+            payload_size=len(payload_text),
         )
 
         try:
             # Decode to str only at the point of use, then zero the bytearray
             # immediately so the plaintext doesn't linger in memory.
             password_str = self.password.decode("utf-8")
-            response = requests.post(
+            post = self.session.post if self.session is not None else requests.post
+            if self.payload_body is not None:
+                post_kwargs: dict[str, Any] = {"data": self.payload_body}
+            else:
+                post_kwargs = {"json": self.payload}
+            response = post(
                 self.url,
-                json=self.payload,
+                **post_kwargs,
                 auth=requests.auth.HTTPDigestAuth(self.user, password_str),
                 headers={"Content-Type": "application/json"},
                 timeout=10,
@@ -111,11 +235,19 @@ class RequestWorker(QThread):
             del password_str
             self.password[:] = b"\x00" * len(self.password)
 
+            # Decode with the declared charset (requests maps application/json
+            # to UTF-8) instead of response.text, which falls back to scanning
+            # the body to guess an encoding when none is declared.
+            try:
+                body = response.content.decode(response.encoding or "utf-8", errors="replace")
+            except LookupError:
+                # The device declared a charset Python doesn't know
+                body = response.content.decode("utf-8", errors="replace")
             text = (
                 f"URL: {self.url}\n"
-                f"Payload: {json.dumps(self.payload, indent=2, ensure_ascii=False)}\n"
+                f"Payload: {payload_text}\n"
                 f"Status Code: {response.status_code}\n"
-                f"{response.text}"
+                f"{body}"
             )
             tag = "ok" if response.status_code == 200 else "warn"
             self.logger.log_request(
@@ -124,7 +256,7 @@ class RequestWorker(QThread):
                 response.status_code,
                 response.elapsed.total_seconds(),
                 preset_name=self.preset_name,
-                response_size=len(response.text),
+                response_size=len(response.content),
             )
 
         except requests.exceptions.RequestException as exc:
@@ -140,7 +272,18 @@ class RequestWorker(QThread):
             )
 
         self._write_log(text, tag)
-        self.finished.emit(text, self.preset_name, tag)
+        if self.cancelled:
+            return
+        if len(text) > _DISPLAY_MAX_CHARS:
+            # Skip formatting and only hand the head to the GUI thread; copying and
+            # laying out a multi-megabyte dump would stall the viewer.
+            text = (
+                f"{text[:_DISPLAY_MAX_CHARS]}\n"
+                f"... {len(text) - _DISPLAY_MAX_CHARS} more characters, see the log file"
+            )
+        elif self.formatter is not None:
+            text = self.formatter(text)
+        self.signals.finished.emit(text, self.preset_name, tag)
 
     def _ensure_log_file(self) -> None:
         """Assign a default log-file path if one was not provided."""
@@ -157,12 +300,13 @@ class RequestWorker(QThread):
         """
         if not self.log_file:
             return
+        entry = f"\n--- {time.strftime('%Y-%m-%d %H:%M:%S')} ---\nTag: {tag}\n{text}\n"
+        if "MultiPreset_Run" in self.log_file.name:
+            entry = f"\n--- Preset: {self.preset_name} ---\n{entry}"
         try:
-            with self.log_file.open("a", encoding="utf-8") as f:
-                if "MultiPreset_Run" in self.log_file.name:
-                    f.write(f"\n--- Preset: {self.preset_name} ---\n")
-                f.write(f"\n--- {datetime.now():%Y-%m-%d %H:%M:%S} ---\n")
-                f.write(f"Tag: {tag}\n{text}\n")
+            # The entry is built up front, so each request costs a single write
+            with _LOG_LOCK, self.log_file.open("a", encoding="utf-8") as f:
+                f.write(entry)
         except Exception as exc:
             self.logger.error(
                 "Failed to write log file",
@@ -178,6 +322,30 @@ class RequestManager:
 
     def __init__(self) -> None:
         self.workers: list[RequestWorker] = []
+        # Workers run on a bounded pool of reused threads rather than one new
+        # thread per request.
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(_MAX_WORKER_THREADS)
+        # One session for every worker, so consecutive requests to the same
+        # device reuse an open keep-alive connection instead of reconnecting.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_HOSTS,
+            pool_maxsize=_POOL_CONNECTIONS_PER_HOST,
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Only the connections are shared: a cookie the device sets would
+        # otherwise be sent back on later requests, even after the credentials
+        # change, and could hide the auth failures this tool is used to find.
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        # Parsed (and pretty-printed) payload files keyed by path, with the mtime
+        # they were read at, so repeated batch runs don't re-read, re-parse or
+        # re-serialise unchanged files.
+        self._payload_cache: OrderedDict[
+            Path, tuple[int, dict[str, Any], str, bytes | None]
+        ] = OrderedDict()
         # Suppress urllib3 warnings that would otherwise fire on every request
         # because target devices use self-signed certificates (verify=False).
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -199,22 +367,62 @@ class RequestManager:
             ``&format=simple``) to the URL.
         :returns: A ``(url, payload)`` tuple ready to pass to :class:`RequestWorker`.
         """
+        url, payload, _, _ = self._resolve_request(ip, endpoint, json_file, simple_format)
+        return url, payload
+
+    def _resolve_request(
+        self,
+        ip: str,
+        endpoint: str,
+        json_file: str | None,
+        simple_format: bool,
+    ) -> tuple[str, dict[str, Any], str, bytes | None]:
+        """Like :meth:`build_request`, plus the payload's pretty-printed text and body."""
         url = f"http://{ip}{endpoint}"
         if simple_format:
             url += "&format=simple" if "?" in url else "?format=simple"
 
-        payload: dict[str, Any] = {}
+        payload, payload_text, payload_body = _EMPTY_PAYLOAD, _EMPTY_PAYLOAD_TEXT, _EMPTY_PAYLOAD_BODY
         if json_file and json_file != "(none)":
             try:
-                with (JSON_FOLDER / json_file.strip()).open("r", encoding="utf-8") as f:
-                    payload = json.load(f)
+                payload, payload_text, payload_body = self._load_payload(
+                    _payload_path(JSON_FOLDER, json_file)
+                )
             except Exception as exc:
                 _logger.error(
                     f"Failed to load JSON file '{json_file}'",
                     file=json_file,
                     error=str(exc),
                 )
-        return url, payload
+        return url, payload, payload_text, payload_body
+
+    def _load_payload(self, path: Path) -> tuple[dict[str, Any], str, bytes | None]:
+        """Return the parsed JSON in *path*, its pretty-printed text and request body.
+
+        The cached copy is reused while the file is unchanged.
+
+        The cache is keyed on the file's ``st_mtime_ns`` and holds at most
+        ``_PAYLOAD_CACHE_SIZE`` files, least recently used evicted first.
+        Cached payloads are shared between requests and must not be mutated.
+
+        :param path: Absolute path of the payload file.
+        :raises OSError: If the file cannot be read.
+        :raises ValueError: If the file is not valid JSON.
+        """
+        mtime = path.stat().st_mtime_ns
+        cached = self._payload_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            self._payload_cache.move_to_end(path)
+            return cached[1], cached[2], cached[3]
+        # The stdlib parser keeps integers beyond 64 bits exact, where orjson turns
+        # them into floats; boundary values must be sent as the file holds them.
+        payload = json.loads(path.read_bytes())
+        payload_text = _pretty_payload(payload)
+        payload_body = _encode_body(payload)
+        self._payload_cache[path] = (mtime, payload, payload_text, payload_body)
+        if len(self._payload_cache) > _PAYLOAD_CACHE_SIZE:
+            self._payload_cache.popitem(last=False)
+        return payload, payload_text, payload_body
 
     def start_new_log(self, preset_name: str) -> Path:
         """Create and return a new timestamped log file path.
@@ -243,8 +451,9 @@ class RequestManager:
         callback: Callable[[str, str, str], None],
         preset_name: str = "",
         log_file: Path | None = None,
+        formatter: Callable[[str], str] | None = None,
     ) -> RequestWorker:
-        """Build, start, and return a :class:`RequestWorker` for the given parameters.
+        """Build a :class:`RequestWorker`, queue it on the pool, and return it.
 
         :param ip: Device IP address.
         :param user: HTTP Digest authentication username.
@@ -256,9 +465,12 @@ class RequestManager:
         :param callback: Called with ``(text, preset_name, tag)`` on completion.
         :param preset_name: Human-readable name used in log output.
         :param log_file: Pre-created log file path for multi-preset runs.
-        :returns: The started :class:`RequestWorker` instance.
+        :param formatter: Optional display formatter run on the worker thread.
+        :returns: The queued :class:`RequestWorker` instance.
         """
-        url, payload = self.build_request(ip, endpoint, json_file, simple_format)
+        url, payload, payload_text, payload_body = self._resolve_request(
+            ip, endpoint, json_file, simple_format
+        )
         worker = RequestWorker(
             url=url,
             user=user,
@@ -267,9 +479,13 @@ class RequestManager:
             preset_name=preset_name,
             json_type=json_type,
             log_file=log_file,
+            formatter=formatter,
+            session=self.session,
+            payload_text=payload_text,
+            payload_body=payload_body,
         )
-        worker.finished.connect(callback)
-        worker.finished.connect(lambda *_: self._remove_worker(worker))
+        worker.signals.finished.connect(callback)
+        worker.signals.done.connect(partial(self._remove_worker, worker))
         self.workers.append(worker)
-        worker.start()
+        self.pool.start(worker)
         return worker
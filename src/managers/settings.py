@@ -1,6 +1,7 @@
 """Settings manager for API Test Tool."""
 from __future__ import annotations
 
+import copy
 import json
 from typing import Any, Final
 
@@ -19,6 +20,8 @@ class SettingsManager:
         """Initialise the manager and load settings from disk."""
         self.settings_file = resource_path(self.SETTINGS_FILE)
         self.settings: dict[str, Any] = {}
+        # Settings as last read from or written to disk; ``None`` until the file exists
+        self._saved: dict[str, Any] | None = None
         self.load_settings()
 
     def load_settings(self) -> None:
@@ -29,15 +32,23 @@ class SettingsManager:
         try:
             with self.settings_file.open("r", encoding="utf-8") as f:
                 self.settings = json.load(f)
+            self._saved = copy.deepcopy(self.settings)
         except Exception as exc:
             _logger.error("Failed to load settings", error=str(exc))
             self.settings = self._get_default_settings()
 
     def save_settings(self) -> None:
-        """Persist the current settings dict to disk."""
+        """Persist the current settings dict to disk.
+
+        Skipped when nothing changed since the file was last read or written,
+        as closing the window re-saves every field the auto-save already wrote.
+        """
+        if self.settings == self._saved:
+            return
         try:
             with self.settings_file.open("w", encoding="utf-8") as f:
                 json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            self._saved = copy.deepcopy(self.settings)
         except Exception as exc:
             _logger.error("Failed to save settings", error=str(exc))
 
@@ -112,16 +123,17 @@ class SettingsManager:
     # ── UI ────────────────────────────────────────────────────────────────────
 
     def get_window_geometry(self) -> str:
-        """Return the saved window geometry as a hex string.
+        """Return the saved window geometry as a base64 string.
 
-        :returns: Hex-encoded geometry bytes, or ``""`` if not set.
+        :returns: Base64-encoded geometry bytes, or ``""`` if not set.
+            Settings from older versions may hold hex instead.
         """
         return self.settings.get("ui", {}).get("window_geometry", "")
 
     def set_window_geometry(self, geometry: str) -> None:
         """Persist the window geometry.
 
-        :param geometry: Hex-encoded geometry bytes from ``QWidget.saveGeometry()``.
+        :param geometry: Base64-encoded geometry bytes from ``QWidget.saveGeometry()``.
         """
         self.settings.setdefault("ui", {})["window_geometry"] = geometry
 
@@ -1,7 +1,7 @@
 """Shared pytest fixtures for the API-tester test suite."""
 from __future__ import annotations
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -39,8 +39,12 @@ def tmp_settings_file(tmp_path: Path) -> Path:
 # ---------------------------------------------------------------------------
 @pytest.fixture()
 def mock_preset_manager() -> MagicMock:
+    from managers.presets import bucket_by_mode
+
     mgr = MagicMock()
     mgr.presets = []
+    # Derive the mode buckets from whatever the test assigns to mgr.presets
+    type(mgr).by_mode = PropertyMock(side_effect=lambda: bucket_by_mode(mgr.presets))
     mgr.get_by_name.return_value = None
     mgr.get_names.return_value = []
     return mgr
@@ -50,8 +54,10 @@ def mock_preset_manager() -> MagicMock:
 def mock_request_manager() -> MagicMock:
     mgr = MagicMock()
     worker = MagicMock()
-    worker.finished = MagicMock()
-    worker.finished.connect = MagicMock()
+    worker.signals.finished = MagicMock()
+    worker.signals.finished.connect = MagicMock()
+    worker.signals.done = MagicMock()
+    worker.signals.done.connect = MagicMock()
     mgr.send_request_async.return_value = worker
     return mgr
 
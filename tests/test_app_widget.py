@@ -98,6 +98,15 @@ class TestSendRequestValidation:
 
         mock_request_manager.send_request_async.assert_called_once()
 
+    def test_formats_response_on_worker_thread(self, app_widget, mock_request_manager):
+        app_widget.ip_edit.setText("10.0.0.1")
+        app_widget.user_edit.setText("admin")
+
+        app_widget.send_request()
+
+        formatter = mock_request_manager.send_request_async.call_args.kwargs["formatter"]
+        assert formatter('{"a":1}') == '{\n  "a": 1\n}'
+
     def test_tracks_worker_after_send(self, app_widget, mock_request_manager):
         app_widget.ip_edit.setText("10.0.0.1")
         app_widget.user_edit.setText("admin")
@@ -139,6 +148,16 @@ class TestCancelRequests:
 
         assert not app_widget.btn_cancel.isEnabled()
 
+    def test_cancel_cancels_each_worker(self, app_widget, mock_request_manager):
+        app_widget.ip_edit.setText("10.0.0.1")
+        app_widget.user_edit.setText("admin")
+        app_widget.send_request()
+        worker = mock_request_manager.send_request_async.return_value
+
+        app_widget.cancel_all_requests()
+
+        worker.cancel.assert_called_once_with()
+
     def test_cancel_with_no_requests_is_noop(self, app_widget):
         # Should not raise
         app_widget.cancel_all_requests()
@@ -172,6 +191,36 @@ class TestLoadPreset:
 
         assert app_widget.endpoint_combo.currentText() == API_ENDPOINTS[0]
 
+    def test_loads_endpoint_and_json_type_by_index(self, app_widget, mock_preset_manager):
+        from config.constants import API_ENDPOINTS
+
+        mock_preset_manager.get_by_name.return_value = {
+            "name": "P1", "endpoint": API_ENDPOINTS[-1],
+            "json_file": "(none)", "json_type": "rpc",
+        }
+        app_widget.preset_combo.addItem("P1")
+        app_widget.preset_combo.setCurrentText("P1")
+
+        app_widget.load_preset()
+
+        assert app_widget.endpoint_combo.currentIndex() == len(API_ENDPOINTS) - 1
+        assert app_widget.json_type_combo.currentText() == "rpc"
+
+    def test_unknown_endpoint_is_added_and_selected(self, app_widget, mock_preset_manager):
+        mock_preset_manager.get_by_name.return_value = {
+            "name": "P1", "endpoint": "/api/custom/Thing",
+            "json_file": "(none)", "json_type": "normal",
+        }
+        app_widget.preset_combo.addItem("P1")
+        app_widget.preset_combo.setCurrentText("P1")
+        count_before = app_widget.endpoint_combo.count()
+
+        app_widget.load_preset()
+        app_widget.load_preset()  # second load reuses the recorded row
+
+        assert app_widget.endpoint_combo.currentText() == "/api/custom/Thing"
+        assert app_widget.endpoint_combo.count() == count_before + 1
+
     def test_warns_when_preset_not_found(self, app_widget, mock_preset_manager):
         mock_preset_manager.get_by_name.return_value = None
         app_widget.preset_combo.addItem("Ghost")
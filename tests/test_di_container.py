@@ -80,6 +80,7 @@ class TestPresetManagerProtocol:
     def test_mock_satisfies_protocol(self):
         class Stub:
             presets: list = []
+            by_mode: dict = {}
             def load_presets(self): ...
             def save_presets(self, presets): ...
             def add_preset(self, preset): ...
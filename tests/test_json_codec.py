@@ -0,0 +1,87 @@
+"""Tests for config/json_codec.py — optional-orjson JSON helpers."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def codec(request, monkeypatch):
+    """The codec module, once as installed and once forced onto the stdlib path."""
+    import config.json_codec as codec
+    if request.param == "stdlib":
+        monkeypatch.setattr(codec, "_orjson", None)
+    return codec
+
+
+class TestLoads:
+    def test_parses_text(self, codec):
+        assert codec.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_parses_bytes(self, codec):
+        assert codec.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_accepts_non_finite_literals(self, codec):
+        # Generated fuzz payloads contain Infinity/NaN, which orjson rejects.
+        assert codec.loads('{"x": Infinity}') == {"x": float("inf")}
+
+    @pytest.mark.parametrize("number", [2**64, -(2**63) - 1, 123456789012345678901234567890])
+    def test_keeps_big_integers_exact(self, codec, number):
+        # orjson alone would parse these as floats.
+        assert codec.loads(f'{{"n": {number}}}') == {"n": number}
+        assert codec.loads(f'{{"n": {number}}}'.encode()) == {"n": number}
+
+    def test_invalid_json_raises_value_error(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads("{bad json}")
+
+
+class TestDumpsPretty:
+    @pytest.mark.parametrize("obj", [
+        {"a": 1, "b": [1, 2, {"c": None}]},
+        [],
+        {"name": "Zürich ✓"},
+        {"nested": {"empty": {}, "flag": True}},
+    ])
+    def test_matches_stdlib_indent_2(self, codec, obj):
+        assert codec.dumps_pretty(obj) == json.dumps(obj, indent=2, ensure_ascii=False)
+
+    @pytest.mark.parametrize("obj", [
+        {"x": float("inf"), "y": float("nan"), "z": None},
+        {"n": 2**64},
+        {"big": 1e16, "small": 1.5e-7, "tiny": 1e-5, "list": [2.5e22, 0.1]},
+        [1e300],
+        1e16,
+    ])
+    def test_keeps_values_orjson_would_change(self, codec, obj):
+        assert codec.dumps_pretty(obj) == json.dumps(obj, indent=2, ensure_ascii=False)
+
+    def test_float_like_strings_stay_on_fast_path(self, monkeypatch):
+        import config.json_codec as codec
+        if codec._orjson is None:
+            pytest.skip("orjson not installed")
+        obj = {"version": "1.5e-7", "ips": ["10.0.0.1"], "n": 3}
+        monkeypatch.setattr(codec.json, "dumps", None)  # fails if the stdlib path runs
+        assert codec.dumps_pretty(obj) == '{\n  "version": "1.5e-7",\n  "ips": [\n    "10.0.0.1"\n  ],\n  "n": 3\n}'
+
+    def test_returns_str(self, codec):
+        assert isinstance(codec.dumps_pretty({"a": 1}), str)
+
+
+class TestDumps:
+    @pytest.mark.parametrize("obj", [
+        {"a": 1, "b": [1, 2, {"c": None}]},
+        [],
+        {"name": "Zürich ✓"},
+    ])
+    def test_round_trips(self, codec, obj):
+        assert json.loads(codec.dumps(obj)) == obj
+
+    def test_returns_compact_bytes(self, codec):
+        assert codec.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_non_finite_raises_value_error(self, codec):
+        # orjson alone would quietly send null in place of Infinity.
+        with pytest.raises(ValueError):
+            codec.dumps({"x": None, "y": float("inf")})
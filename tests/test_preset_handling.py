@@ -1,6 +1,9 @@
 """Tests for app/preset_handling.py — PresetHandlingMixin (pure-logic method)."""
 from __future__ import annotations
 
+from collections import deque
+from unittest.mock import MagicMock, patch
+
 import pytest
 from tests.helpers import SAMPLE_PRESETS
 
@@ -86,3 +89,103 @@ class TestPresetMatches:
     ])
     def test_sample_presets(self, mixin, preset, mode, search, expected):
         assert mixin._preset_matches(preset, mode, search) is expected
+
+
+# ---------------------------------------------------------------------------
+# update_presets_list — incremental narrowing
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def list_mixin(mixin):
+    """Mixin wired with mocked widgets and a real by_mode bucket."""
+    from unittest.mock import MagicMock
+    from managers.presets import bucket_by_mode
+
+    mixin.presets = MagicMock()
+    mixin.presets.by_mode = bucket_by_mode(SAMPLE_PRESETS)
+    mixin.preset_search = MagicMock()
+    mixin.test_mode_combo = MagicMock()
+    mixin.test_mode_combo.currentText.return_value = "happy"
+    mixin.preset_combo = MagicMock()
+    mixin.json_combo = MagicMock()
+    mixin.on_preset_changed = MagicMock()
+    mixin._last_search = ""
+    mixin._search_bucket = None
+    mixin._search_matches = []
+    return mixin
+
+
+def _search(mixin, text):
+    mixin.preset_search.text.return_value = text
+    mixin.update_presets_list()
+    return mixin.preset_combo.addItems.call_args[0][0]
+
+
+class TestIncrementalNarrowing:
+    def test_extending_search_rescans_only_previous_matches(self, list_mixin):
+        assert _search(list_mixin, "get") == ["GetContacts Happy", "GetSIPAccount"]
+        # A preset added to the same bucket object is not a previous match,
+        # so the narrowed search must not see it.
+        list_mixin.presets.by_mode["happy"].append(("getcontacts late", {"name": "late"}))
+        assert _search(list_mixin, "getc") == ["GetContacts Happy"]
+
+    def test_shortening_search_rescans_full_bucket(self, list_mixin):
+        assert _search(list_mixin, "getsip") == ["GetSIPAccount"]
+        assert _search(list_mixin, "get") == ["GetContacts Happy", "GetSIPAccount"]
+
+    def test_new_bucket_invalidates_previous_matches(self, list_mixin):
+        from managers.presets import bucket_by_mode
+        assert _search(list_mixin, "zzz") == []
+        list_mixin.presets.by_mode = bucket_by_mode(SAMPLE_PRESETS + [
+            {"name": "zzz", "json_file": "get/normal_action/z.json"},
+        ])
+        assert _search(list_mixin, "zzzz") == []
+        assert _search(list_mixin, "zzz") == ["zzz"]
+
+    def test_empty_search_lists_whole_bucket(self, list_mixin):
+        names = [preset["name"] for _, preset in list_mixin.presets.by_mode["happy"]]
+        assert _search(list_mixin, "") == names
+        assert list_mixin._search_matches is not list_mixin.presets.by_mode["happy"]
+
+    def test_mode_switch_uses_other_bucket(self, list_mixin):
+        assert _search(list_mixin, "get") == ["GetContacts Happy", "GetSIPAccount"]
+        list_mixin.test_mode_combo.currentText.return_value = "unhappy"
+        assert _search(list_mixin, "getc") == ["GetContacts Unhappy"]
+
+
+# ---------------------------------------------------------------------------
+# _on_multi_done (batch slot accounting)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def batch_mixin(mixin):
+    """Mixin mid-batch: 6 presets, 4 in flight, 2 queued."""
+    mixin.workers = [MagicMock() for _ in range(4)]
+    mixin.active_requests = list(mixin.workers)
+    mixin._multi_queue = deque(["P5", "P6"])
+    mixin._multi_total = 6
+    mixin._multi_in_flight = 4
+    mixin._untrack_request = lambda w: mixin.active_requests.remove(w)
+    mixin._update_progress = MagicMock()
+    return mixin
+
+
+class TestMultiDone:
+    def test_releases_slot_and_schedules_next(self, batch_mixin):
+        with patch("app.preset_handling.QTimer") as timer:
+            batch_mixin._on_multi_done(batch_mixin.workers[0])
+        assert batch_mixin._multi_in_flight == 3
+        batch_mixin._update_progress.assert_called_once_with(1, 6)
+        timer.singleShot.assert_called_once()
+
+    def test_ignores_workers_dropped_by_cancel(self, batch_mixin):
+        # As cancel_all_requests leaves it, with signals still queued
+        batch_mixin.active_requests.clear()
+        batch_mixin._multi_queue.clear()
+        batch_mixin._multi_in_flight = 0
+        with patch("app.preset_handling.QTimer") as timer:
+            for worker in batch_mixin.workers:
+                batch_mixin._on_multi_done(worker)
+        assert batch_mixin._multi_in_flight == 0
+        batch_mixin._update_progress.assert_not_called()
+        timer.singleShot.assert_not_called()
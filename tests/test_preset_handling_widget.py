@@ -65,6 +65,38 @@ class TestUpdatePresetsList:
         app_widget.update_presets_list()
         assert app_widget.preset_combo.count() == 0
 
+    def test_syncs_selected_preset_exactly_once(self, app_widget, mock_preset_manager):
+        """Rebuilding the combo must not re-enter on_preset_changed per added item."""
+        mock_preset_manager.presets = [
+            {"name": f"P{i}", "json_file": f"get/normal_action/p{i}.json",
+             "simple_format": False, "json_type": "normal"}
+            for i in range(5)
+        ]
+        app_widget.test_mode_combo.setCurrentText("happy")
+        app_widget.preset_search.setText("")
+        mock_preset_manager.get_by_name.reset_mock()
+        app_widget.update_presets_list()
+        # on_preset_changed looks the preset up once; signal re-entry would add more calls
+        mock_preset_manager.get_by_name.assert_called_once_with("P0")
+        assert app_widget.preset_combo.count() == 5
+
+
+class TestSearchDebounce:
+    def test_typing_defers_rebuild_until_timer_fires(self, app_widget, qtbot, mock_preset_manager):
+        """Keystrokes only restart the debounce timer; one rebuild follows."""
+        mock_preset_manager.presets = [
+            {"name": "GetContacts", "json_file": "get/normal_action/foo.json",
+             "simple_format": False, "json_type": "normal"},
+        ]
+        app_widget.test_mode_combo.setCurrentText("happy")
+        app_widget.update_presets_list()
+        for partial in ("z", "zz", "zzz"):
+            app_widget.preset_search.setText(partial)
+        assert app_widget._filter_timer.isActive()
+        assert app_widget.preset_combo.count() == 1  # not rebuilt yet
+        qtbot.waitUntil(lambda: not app_widget._filter_timer.isActive(), timeout=1000)
+        assert app_widget.preset_combo.count() == 0
+
 
 # ---------------------------------------------------------------------------
 # on_preset_changed  (lines 39-48)
@@ -81,6 +113,7 @@ class TestOnPresetChanged:
         }
         app_widget.on_preset_changed("P1")
         assert app_widget.json_combo.currentText() == "get/normal_action/foo.json"
+        assert app_widget.json_combo.toolTip() == "get/normal_action/foo.json"
 
     def test_unknown_preset_is_noop(self, app_widget, mock_preset_manager):
         """If get_by_name returns None, json_combo is left unchanged."""
@@ -134,8 +167,9 @@ class TestSavePreset:
 
 class TestRunMultiple:
     def test_warns_when_no_presets_available(self, app_widget):
-        """preset_combo empty → QMessageBox.warning, nothing else."""
-        app_widget.preset_combo.clear()
+        """No preset matches the filter → QMessageBox.warning, nothing else."""
+        app_widget.preset_search.setText("no such preset")
+        app_widget.update_presets_list()
         with patch("app.preset_handling.QMessageBox.warning") as mock_warn:
             app_widget.run_multiple()
             mock_warn.assert_called_once()
@@ -236,7 +270,7 @@ class TestRunMultiple:
                 mock_crit.assert_called_once()
 
     def test_skips_invalid_preset_and_continues(self, app_widget, mock_preset_manager, qtbot):
-        """run_next: preset not found → status shows 'Skipping', moves to next via QTimer."""
+        """_run_next_preset: preset not found → status shows 'Skipping', moves to next via QTimer."""
         mock_preset_manager.presets = [
             {"name": "Ghost", "json_file": "get/normal_action/foo.json",
              "simple_format": False, "json_type": "normal"},
@@ -252,12 +286,12 @@ class TestRunMultiple:
             MockDlg.return_value.selected = ["Ghost"]
             app_widget.run_multiple()
 
-        # Allow QTimer.singleShot(0, run_next) to fire
+        # Allow QTimer.singleShot(0, _run_next_preset) to fire
         qtbot.wait(50)
         assert "Skipping" in app_widget.status.text() or "finished" in app_widget.status.text()
 
     def test_send_exception_in_run_next_continues(self, app_widget, mock_preset_manager, qtbot):
-        """run_next: send_request_async raises → status shows error, moves on via QTimer."""
+        """_run_next_preset: send_request_async raises → status shows error, moves on via QTimer."""
         preset = {"name": "P1", "endpoint": "/api/test",
                   "json_file": "get/normal_action/foo.json",
                   "simple_format": False, "json_type": "normal"}
@@ -287,7 +321,7 @@ class TestRunMultiple:
         app_widget.ip_edit.setText("10.0.0.1")
         app_widget.user_edit.setText("admin")
 
-        # Capture on_response callback and call it synchronously to trigger run_next → empty queue
+        # Capture on_response callback and call it synchronously to trigger _run_next_preset → empty queue
         captured = {}
 
         def capture_callback(*args, **kwargs):
@@ -301,12 +335,80 @@ class TestRunMultiple:
             MockDlg.return_value.selected = ["P1"]
             app_widget.run_multiple()
 
-        # Fire the on_response callback — this triggers QTimer.singleShot(0, run_next)
-        # with empty queue → "All presets finished"
+        # Fire the on_response callback, then done — which triggers
+        # QTimer.singleShot(0, _run_next_preset) with empty queue → "All presets finished"
         if captured.get("callback"):
             captured["callback"]("response", "P1", "ok")
+        app_widget._on_multi_done(app_widget.requests.send_request_async.return_value)
 
         qtbot.wait(50)
         assert "finished" in app_widget.status.text().lower()
 
+    def test_runs_up_to_four_presets_at_once(self, app_widget, mock_preset_manager, qtbot):
+        """Four presets are sent at once; each finished worker lets one more start."""
+        preset = {"name": "P1", "endpoint": "/api/test",
+                  "json_file": "get/normal_action/foo.json",
+                  "simple_format": False, "json_type": "normal"}
+        mock_preset_manager.presets = [preset]
+        mock_preset_manager.get_by_name.return_value = preset
+        app_widget.update_presets_list()
+        app_widget.ip_edit.setText("10.0.0.1")
+        app_widget.user_edit.setText("admin")
+
+        with patch("app.preset_handling.MultiSelectDialog") as MockDlg:
+            MockDlg.return_value.exec.return_value = True
+            MockDlg.return_value.selected = ["P1"] * 6
+            app_widget.run_multiple()
+
+        assert app_widget.requests.send_request_async.call_count == 4
+        # done alone frees the slot, as for a worker that died without a response
+        app_widget._on_multi_done(app_widget.requests.send_request_async.return_value)
+        qtbot.wait(50)
+        assert app_widget.requests.send_request_async.call_count == 5
+        assert app_widget.status.text() == "Progress: 1/6 requests"
 
+    def test_cancel_drops_remaining_batch(self, app_widget, mock_preset_manager):
+        """Cancelling mid-run empties the batch queue and forgets the cached password."""
+        preset = {"name": "P1", "endpoint": "/api/test",
+                  "json_file": "get/normal_action/foo.json",
+                  "simple_format": False, "json_type": "normal"}
+        mock_preset_manager.presets = [preset]
+        mock_preset_manager.get_by_name.return_value = preset
+        app_widget.update_presets_list()
+        app_widget.ip_edit.setText("10.0.0.1")
+        app_widget.user_edit.setText("admin")
+        app_widget.pass_edit.setText("secret")
+
+        with patch("app.preset_handling.MultiSelectDialog") as MockDlg:
+            MockDlg.return_value.exec.return_value = True
+            MockDlg.return_value.selected = ["P1"] * 6
+            app_widget.run_multiple()
+
+        assert len(app_widget._multi_queue) == 2
+        app_widget.cancel_all_requests()
+        assert not app_widget._multi_queue
+        assert app_widget._multi_password == ""
+
+    def test_late_signals_after_cancel_are_ignored(self, app_widget, mock_preset_manager, qtbot):
+        """Signals still queued when the batch is cancelled don't revive it."""
+        preset = {"name": "P1", "endpoint": "/api/test",
+                  "json_file": "get/normal_action/foo.json",
+                  "simple_format": False, "json_type": "normal"}
+        mock_preset_manager.presets = [preset]
+        mock_preset_manager.get_by_name.return_value = preset
+        app_widget.update_presets_list()
+        app_widget.ip_edit.setText("10.0.0.1")
+        app_widget.user_edit.setText("admin")
+
+        with patch("app.preset_handling.MultiSelectDialog") as MockDlg:
+            MockDlg.return_value.exec.return_value = True
+            MockDlg.return_value.selected = ["P1"] * 6
+            app_widget.run_multiple()
+
+        app_widget.cancel_all_requests()
+        app_widget._on_multi_response("late", "P1", "ok")
+        app_widget._on_multi_done(app_widget.requests.send_request_async.return_value)
+        qtbot.wait(50)
+        assert app_widget._multi_in_flight == 0
+        assert app_widget.requests.send_request_async.call_count == 4
+        assert app_widget.status.text() == "All requests cancelled"
@@ -69,6 +69,14 @@ class TestAddAndGet:
         assert len(mgr.presets) == 1
         assert mgr.presets[0]["endpoint"] == "/new"
 
+    def test_replace_keeps_position(self, tmp_path):
+        mgr = _make_manager(tmp_path / "p.json")
+        for name in ("A", "B", "C"):
+            mgr.add_preset({"name": name, "endpoint": "/old"})
+        mgr.add_preset({"name": "B", "endpoint": "/new"})
+        assert mgr.get_names() == ["A", "B", "C"]
+        assert mgr.presets[1]["endpoint"] == "/new"
+
     def test_add_without_name_is_no_op(self, tmp_path):
         mgr = _make_manager(tmp_path / "p.json")
         mgr.add_preset({"endpoint": "/x"})
@@ -93,6 +101,18 @@ class TestSavePresets:
         mgr2 = _make_manager(f)
         assert mgr2.get_by_name("Save Me") is not None
 
+    def test_failed_save_keeps_previous_file(self, tmp_path):
+        f = tmp_path / "p.json"
+        mgr = _make_manager(f)
+        mgr.add_preset({"name": "Old", "endpoint": "/o"})
+        before = f.read_text(encoding="utf-8")
+
+        with patch("managers.presets.os.replace", side_effect=OSError("disk full")):
+            mgr.add_preset({"name": "New", "endpoint": "/n"})
+
+        assert f.read_text(encoding="utf-8") == before
+        assert list(tmp_path.iterdir()) == [f]  # temporary file cleaned up
+
     def test_save_fails_silently_on_bad_path(self, tmp_path):
         """Should not raise even when the file cannot be written."""
         mgr = _make_manager(tmp_path / "p.json")
@@ -159,3 +179,88 @@ class TestGetNames:
         mgr = _make_manager(tmp_path / "p.json")
         assert mgr.get_names() == []
 
+    def test_tracks_mutations_and_returns_a_copy(self, tmp_path):
+        mgr = _make_manager(tmp_path / "p.json")
+        mgr.add_preset({"name": "A"})
+        mgr.add_preset({"name": "B"})
+        mgr.delete_preset("A")
+        names = mgr.get_names()
+        assert names == ["B"]
+        names.append("junk")
+        assert mgr.get_names() == ["B"]
+
+
+# ---------------------------------------------------------------------------
+# get_by_name (name index)
+# ---------------------------------------------------------------------------
+
+class TestGetByName:
+    def test_returns_first_of_duplicate_names(self, tmp_path):
+        f = tmp_path / "p.json"
+        f.write_text(json.dumps([{"name": "D", "endpoint": "/first"},
+                                 {"name": "D", "endpoint": "/second"}]), encoding="utf-8")
+        mgr = _make_manager(f)
+        assert mgr.get_by_name("D")["endpoint"] == "/first"
+
+    def test_tracks_add_replace_and_delete(self, tmp_path):
+        mgr = _make_manager(tmp_path / "p.json")
+        mgr.add_preset({"name": "X", "endpoint": "/old"})
+        mgr.add_preset({"name": "X", "endpoint": "/new"})
+        assert mgr.get_by_name("X")["endpoint"] == "/new"
+        mgr.delete_preset("X")
+        assert mgr.get_by_name("X") is None
+
+
+
+# ---------------------------------------------------------------------------
+# by_mode (precomputed search buckets)
+# ---------------------------------------------------------------------------
+
+class TestByMode:
+    def test_built_on_load(self, tmp_path):
+        f = tmp_path / "p.json"
+        f.write_text(
+            json.dumps([
+                {"name": "GetContacts", "endpoint": "/c", "json_file": "get/unhappy/c.json",
+                 "simple_format": False, "json_type": "normal"},
+                {"name": "GetSIP", "endpoint": "/s", "json_file": "get/normal_action/s.json",
+                 "simple_format": False, "json_type": "normal"},
+            ]),
+            encoding="utf-8"
+        )
+        mgr = _make_manager(f)
+        assert [n for n, _ in mgr.by_mode["unhappy"]] == ["getcontacts"]
+        assert [n for n, _ in mgr.by_mode["happy"]] == ["getsip"]
+
+    def test_skips_presets_without_json_file(self, tmp_path):
+        mgr = _make_manager(tmp_path / "p.json")
+        mgr.add_preset({"name": "NoFile", "endpoint": "/x"})
+        assert mgr.by_mode == {"happy": [], "unhappy": []}
+
+    def test_updated_on_add_and_replace(self, tmp_path):
+        mgr = _make_manager(tmp_path / "p.json")
+        mgr.add_preset({"name": "X", "endpoint": "/x", "json_file": "get/normal_action/x.json",
+                        "simple_format": False, "json_type": "normal"})
+        mgr.add_preset({"name": "X", "endpoint": "/x", "json_file": "get\\unhappy\\x.json",
+                        "simple_format": False, "json_type": "normal"})
+        assert mgr.by_mode["happy"] == []
+        assert mgr.by_mode["unhappy"] == [("x", mgr.presets[0])]
+
+    def test_add_replaces_bucket_without_full_rebuild(self, tmp_path):
+        mgr = _make_manager(tmp_path / "p.json")
+        mgr.add_preset({"name": "A", "json_file": "get/normal_action/a.json"})
+        before = mgr.by_mode["happy"]
+        with patch("managers.presets.bucket_by_mode") as rebuild:
+            mgr.add_preset({"name": "B", "json_file": "get/normal_action/b.json"})
+        rebuild.assert_not_called()
+        # A new list object, so cached search results over the old one are invalidated
+        assert mgr.by_mode["happy"] is not before
+        assert [n for n, _ in mgr.by_mode["happy"]] == ["a", "b"]
+        assert mgr.get_by_name("B")["json_file"] == "get/normal_action/b.json"
+
+    def test_updated_on_delete(self, tmp_path):
+        mgr = _make_manager(tmp_path / "p.json")
+        mgr.add_preset({"name": "X", "endpoint": "/x", "json_file": "x.json",
+                        "simple_format": False, "json_type": "normal"})
+        mgr.delete_preset("X")
+        assert mgr.by_mode == {"happy": [], "unhappy": []}
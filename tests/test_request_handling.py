@@ -60,16 +60,19 @@ def _make_mixin():
     # Any call like obj.logger.log_user_action("x") silently succeeds and is recorded.
     obj.logger = MagicMock()   # replaces the structlog logger
     obj.status = MagicMock()   # replaces the QLabel status bar
-    obj.response = MagicMock() # replaces the QTextEdit response widget
+    obj.response = MagicMock() # replaces the QPlainTextEdit response widget
+    obj._pending_responses = []
+    obj._response_timer = MagicMock()  # replaces the QTimer that batches appends
+    obj._response_timer.isActive.return_value = False
     return obj
 
 
 # ---------------------------------------------------------------------------
 # _validate_ip
 # ---------------------------------------------------------------------------
-# _validate_ip uses only Python's stdlib ipaddress module — zero Qt dependency.
+# _validate_ip uses only the stdlib socket.inet_pton — zero Qt dependency.
 # pytest.mark.parametrize runs the same test function once per value in the list,
-# so 6 valid IPs → 6 separate test cases, 6 invalid IPs → 6 more, all from 2 methods.
+# so each valid and invalid IP below becomes its own test case, all from 2 methods.
 
 class TestValidateIp:
     def setup_method(self):
@@ -82,8 +85,9 @@ class TestValidateIp:
         "10.0.0.1",
         "255.255.255.255",
         "0.0.0.0",
-        "::1",          # IPv6 loopback
-        "2001:db8::1",  # IPv6 documentation address
+        "::1",           # IPv6 loopback
+        "2001:db8::1",   # IPv6 documentation address
+        "fe80::1%eth0",  # IPv6 link-local with a scope id
     ])
     def test_valid_ips(self, ip):
         assert self.mixin._validate_ip(ip) is True
@@ -95,17 +99,32 @@ class TestValidateIp:
         "192.168.1",        # only 3 octets
         "192.168.1.1.1",    # 5 octets
         "abc::xyz",         # invalid IPv6 hex
+        "010.0.0.1",        # leading zeros are ambiguous (octal?)
+        "10.0.0.1\x00",     # pasted NUL character
+        "10.0.0.1%eth0",    # scope ids are IPv6-only
+        "fe80::1%",         # empty scope id
     ])
     def test_invalid_ips(self, ip):
         assert self.mixin._validate_ip(ip) is False
 
+    def test_repeated_ip_served_from_cache(self):
+        # The same device IP is validated on every send; it is parsed only once.
+        from app.request_handling import _is_valid_ip
+        _is_valid_ip.cache_clear()
+        with patch("app.request_handling.socket.inet_pton") as mock_parse:
+            assert self.mixin._validate_ip("10.0.0.1") is True
+            assert self.mixin._validate_ip("10.0.0.1") is True
+        mock_parse.assert_called_once()
+        _is_valid_ip.cache_clear()
+
 
 # ---------------------------------------------------------------------------
 # _format_json_response
 # ---------------------------------------------------------------------------
 # _format_json_response uses only Python's json module — no Qt.
-# It finds the first '{' or '[' in the text, tries to parse from there,
-# and returns pretty-printed JSON if successful, or the original text if not.
+# It finds the first '{' or '[' in the text, tries to parse from there (skipping
+# any complete document that ends early), and returns pretty-printed JSON if
+# successful, or the original text if not.
 
 class TestFormatJsonResponse:
     def setup_method(self):
@@ -140,71 +159,103 @@ class TestFormatJsonResponse:
         # Edge case: empty input → empty output, no crash.
         assert self.mixin._format_json_response("") == ""
 
+    def test_pretty_prints_top_level_array(self):
+        result = self.mixin._format_json_response('Status: 200\n[1,{"a":2}]')
+        assert result.startswith("Status: 200\n[\n")
+        assert '"a": 2' in result
 
-# ---------------------------------------------------------------------------
-# _escape_html
-# ---------------------------------------------------------------------------
-# _escape_html is pure string manipulation — replaces &, <, > with HTML entities.
-# Completely independent of Qt; no mixin state used at all.
-
-class TestEscapeHtml:
-    def setup_method(self):
-        self.mixin = _make_mixin()
-
-    def test_escapes_ampersand(self):
-        assert "&amp;" in self.mixin._escape_html("a & b")
-
-    def test_escapes_less_than(self):
-        assert "&lt;" in self.mixin._escape_html("<tag>")
-
-    def test_escapes_greater_than(self):
-        assert "&gt;" in self.mixin._escape_html("<tag>")
-
-    def test_no_change_for_plain_text(self):
-        # Nothing to escape → string passes through unchanged.
-        assert self.mixin._escape_html("hello") == "hello"
+    def test_skips_echoed_payload_before_body(self):
+        # Worker text echoes the request payload ahead of the response body.
+        text = 'Payload: {\n  "x": Infinity\n}\nStatus Code: 200\n{"a":1}'
+        result = self.mixin._format_json_response(text)
+        assert result == 'Payload: {\n  "x": Infinity\n}\nStatus Code: 200\n{\n  "a": 1\n}'
 
-    def test_all_three_chars(self):
-        # All three special characters present in one string.
-        result = self.mixin._escape_html("a < b & c > d")
-        assert "&lt;" in result
-        assert "&amp;" in result
-        assert "&gt;" in result
+    @pytest.mark.parametrize("body, expected", [
+        ('{"x": Infinity, "y": NaN}', '{\n  "x": Infinity,\n  "y": NaN\n}'),
+        ('{"id": 18446744073709551616}', '{\n  "id": 18446744073709551616\n}'),
+    ])
+    def test_shows_values_exactly_as_sent(self, body, expected):
+        result = self.mixin._format_json_response(f"Status Code: 200\n{body}")
+        assert result == f"Status Code: 200\n{expected}"
+
+    def test_non_json_tail_skips_parsing(self):
+        # A body that does not end in '}' or ']' cannot be JSON — no parse attempted.
+        from app.request_handling import _prettify
+        _prettify.cache_clear()
+        text = 'Payload: {"a": 1}\nStatus Code: 200\nOK\r\n'
+        with patch("app.request_handling._JSON_DECODER") as mock_decoder:
+            assert self.mixin._format_json_response(text) == text
+        mock_decoder.raw_decode.assert_not_called()
+
+    def test_many_documents_returned_unchanged_in_linear_time(self):
+        # An NDJSON body: only a bounded number of documents is ever decoded.
+        text = "Status Code: 200\n" + "\n".join(f'{{"i": {i}}}' for i in range(20_000))
+        with patch(
+            "app.request_handling._JSON_DECODER.raw_decode",
+            wraps=json.JSONDecoder().raw_decode,
+        ) as raw_decode:
+            assert self.mixin._format_json_response(text) == text
+        assert raw_decode.call_count <= 3
+
+    def test_repeated_text_served_from_cache(self):
+        # Identical bodies (common in batch runs) are parsed only once.
+        from app.request_handling import _prettify
+        _prettify.cache_clear()
+        text = 'Status: 200\n{"cached": true}'
+        first = self.mixin._format_json_response(text)
+        second = self.mixin._format_json_response(text)
+        assert first == second
+        assert _prettify.cache_info().hits == 1
+
+    def test_large_text_bypasses_cache(self):
+        # Caching megabyte-sized bodies would pin them in memory for the session.
+        from app.request_handling import _PRETTIFY_CACHE_MAX_CHARS, _prettify
+        _prettify.cache_clear()
+        text = 'Status: 200\n{"a": "' + "x" * _PRETTIFY_CACHE_MAX_CHARS + '"}'
+        result = self.mixin._format_json_response(text)
+        assert result.endswith('{\n  "a": "' + "x" * _PRETTIFY_CACHE_MAX_CHARS + '"\n}')
+        assert _prettify.cache_info().currsize == 0
 
 
 # ---------------------------------------------------------------------------
-# _build_response_html
+# _build_response_text
 # ---------------------------------------------------------------------------
-# _build_response_html assembles an HTML string from parts — no Qt rendering.
-# It calls _escape_html internally and produces a string; the real app then
-# hands that string to a QTextEdit, but that step is NOT tested here.
+# _build_response_text assembles a plain string from parts — no Qt rendering.
+# The real app hands that string to QPlainTextEdit.appendPlainText, but that
+# step is NOT tested here. No HTML is involved, so nothing needs escaping.
 
-class TestBuildResponseHtml:
+class TestBuildResponseText:
     def setup_method(self):
         self.mixin = _make_mixin()
 
-    def test_contains_preset_name(self):
-        html = self.mixin._build_response_html("body", "MyPreset", "ok")
-        assert "MyPreset" in html
+    def test_contains_upper_cased_preset_name(self):
+        text = self.mixin._build_response_text("body", "MyPreset", "ok")
+        assert "MYPRESET" in text
 
     def test_contains_body_text(self):
-        html = self.mixin._build_response_html("hello world", "P", "ok")
-        assert "hello world" in html
+        text = self.mixin._build_response_text("hello world", "P", "ok")
+        assert text.endswith("hello world")
+
+    def test_newlines_preserved(self):
+        # Plain text keeps real newlines — no <br> conversion.
+        text = self.mixin._build_response_text("line1\nline2", "P", "ok")
+        assert "line1\nline2" in text
+        assert "<br>" not in text
 
-    def test_newlines_converted_to_br(self):
-        # Multi-line response bodies must use <br> tags so HTML renders correctly.
-        html = self.mixin._build_response_html("line1\nline2", "P", "ok")
-        assert "<br>" in html
+    def test_special_chars_not_escaped(self):
+        # Angle brackets and ampersands are shown verbatim in a plain-text viewer.
+        text = self.mixin._build_response_text("<b>a & b</b>", "P", "ok")
+        assert "<b>a & b</b>" in text
 
-    def test_html_special_chars_escaped(self):
-        # Body text goes through _escape_html before being embedded in HTML.
-        html = self.mixin._build_response_html("<b>bold</b>", "P", "ok")
-        assert "&lt;b&gt;" in html
+    def test_starts_with_separator_line(self):
+        from app.request_handling import _SEPARATOR
+        text = self.mixin._build_response_text("body", "P", "ok")
+        assert text.splitlines()[0] == _SEPARATOR
 
     def test_fallback_label_when_no_preset_name(self):
         # When no preset name is provided the method should show a generic label.
-        html = self.mixin._build_response_html("body", "", "ok")
-        assert "Request" in html
+        text = self.mixin._build_response_text("body", "", "ok")
+        assert "REQUEST" in text
 
 
 # ---------------------------------------------------------------------------
@@ -285,25 +336,66 @@ class TestTrackUntrack:
 # ---------------------------------------------------------------------------
 # display_response
 # ---------------------------------------------------------------------------
-# display_response calls _format_json_response → _build_response_html → insertHtml.
-# self.response is a MagicMock, so insertHtml is recorded without needing a real widget.
+# display_response queues the _build_response_text result and starts the flush
+# timer; _flush_responses then hands everything queued to appendPlainText at once.
+# Formatting already happened on the worker thread, so the text is appended as given.
+# self.response is a MagicMock, so appendPlainText is recorded without needing a real widget.
 
 class TestDisplayResponse:
-    def test_calls_insert_html(self):
+    def test_calls_append_plain_text(self):
         mixin = _make_mixin()
         mixin.display_response("hello", "MyPreset", "ok")
-        mixin.response.insertHtml.assert_called_once()
+        mixin._flush_responses()
+        mixin.response.appendPlainText.assert_called_once()
 
-    def test_inserted_html_contains_body_text(self):
+    def test_appended_text_contains_body_text(self):
         mixin = _make_mixin()
         mixin.display_response("response body", "P", "ok")
-        html_arg = mixin.response.insertHtml.call_args[0][0]
-        assert "response body" in html_arg
+        mixin._flush_responses()
+        text_arg = mixin.response.appendPlainText.call_args[0][0]
+        assert "response body" in text_arg
 
-    def test_moves_cursor_to_end(self):
+    def test_appended_text_is_not_reformatted(self):
+        mixin = _make_mixin()
+        with patch("app.request_handling._prettify") as mock_prettify:
+            mixin.display_response('{"a":1}', "P", "ok")
+            mixin._flush_responses()
+        mock_prettify.assert_not_called()
+        text_arg = mixin.response.appendPlainText.call_args[0][0]
+        assert '{"a":1}' in text_arg
+
+    def test_does_not_insert_html(self):
         mixin = _make_mixin()
         mixin.display_response("x", "P", "ok")
-        # moveCursor must be called at least once (before and after insertHtml)
-        assert mixin.response.moveCursor.call_count >= 1
+        mixin._flush_responses()
+        mixin.response.insertHtml.assert_not_called()
 
+    def test_waits_for_flush_timer(self):
+        mixin = _make_mixin()
+        mixin.display_response("x", "P", "ok")
+        mixin.response.appendPlainText.assert_not_called()
+        mixin._response_timer.start.assert_called_once()
 
+    def test_burst_is_appended_in_one_call(self):
+        mixin = _make_mixin()
+        mixin.display_response("first", "A", "ok")
+        mixin._response_timer.isActive.return_value = True
+        mixin.display_response("second", "B", "err")
+        mixin._response_timer.start.assert_called_once()
+        mixin._flush_responses()
+        mixin.response.appendPlainText.assert_called_once()
+        text_arg = mixin.response.appendPlainText.call_args[0][0]
+        assert text_arg.index("first") < text_arg.index("second")
+        assert mixin._pending_responses == []
+
+    def test_flush_with_nothing_queued_does_nothing(self):
+        mixin = _make_mixin()
+        mixin._flush_responses()
+        mixin.response.appendPlainText.assert_not_called()
+
+    def test_clear_drops_queued_responses(self):
+        mixin = _make_mixin()
+        mixin.display_response("x", "P", "ok")
+        mixin.clear_response()
+        mixin._flush_responses()
+        mixin.response.appendPlainText.assert_not_called()
@@ -1,6 +1,8 @@
 """Tests for managers/requests_manager.py — helpers and RequestManager."""
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -13,17 +15,22 @@ import pytest
 
 @pytest.fixture()
 def request_manager():
-    """A RequestManager with LOGS_FOLDER patched to avoid touching the real log dir."""
+    """A RequestManager with LOGS_FOLDER patched to avoid touching the real log dir.
+
+    Its thread pool is a MagicMock, so queued workers are recorded but never run.
+    """
     with patch("managers.requests_manager.LOGS_FOLDER") as mock_logs:
         mock_logs.mkdir = MagicMock()
         mock_logs.__truediv__ = lambda self, other: Path("/tmp") / other
         from managers.requests_manager import RequestManager
-        yield RequestManager()
+        mgr = RequestManager()
+        mgr.pool = MagicMock()
+        yield mgr
 
 
 @pytest.fixture()
 def make_worker(tmp_path):
-    """Factory that builds a RequestWorker in isolation (no QThread.start, no HTTP)."""
+    """Factory that builds a RequestWorker in isolation (no thread pool, no HTTP)."""
     from managers.requests_manager import RequestWorker
 
     def _factory(preset_name="MyPreset", log_file=None):
@@ -35,6 +42,12 @@ def make_worker(tmp_path):
         worker.preset_name = preset_name
         worker.json_type = "normal"
         worker.log_file = log_file
+        worker.formatter = None
+        worker.session = None
+        worker.payload_text = None
+        worker.payload_body = None
+        worker.signals = MagicMock()
+        worker.cancelled = False
         worker.logger = MagicMock()
         return worker
 
@@ -105,11 +118,66 @@ class TestBuildRequest:
             _, payload = request_manager.build_request("10.0.0.1", "/api/call", "test.json", False)
         assert payload == {"method": "GetContacts"}
 
+    def test_loads_non_finite_fuzz_payload(self, request_manager, tmp_path):
+        # Generated fuzz files contain Infinity, which orjson alone would reject
+        (tmp_path / "fuzz.json").write_text('{"n": Infinity}', encoding="utf-8")
+        with patch("managers.requests_manager.JSON_FOLDER", tmp_path):
+            _, payload = request_manager.build_request("10.0.0.1", "/api/call", "fuzz.json", False)
+        assert payload == {"n": float("inf")}
+
+    def test_big_integer_payload_is_sent_exactly(self, request_manager, tmp_path):
+        # Beyond 64 bits orjson would parse this as a float and send 1.8e19
+        (tmp_path / "big.json").write_text('{"id": 18446744073709551616}', encoding="utf-8")
+        with patch("managers.requests_manager.JSON_FOLDER", tmp_path):
+            _, payload, _, body = request_manager._resolve_request(
+                "10.0.0.1", "/api/call", "big.json", False
+            )
+        assert payload == {"id": 2**64}
+        assert body == b'{"id":18446744073709551616}'
+
+    def test_unchanged_file_is_parsed_once(self, request_manager, tmp_path):
+        (tmp_path / "p.json").write_text('{"a": 1}', encoding="utf-8")
+        with (
+            patch("managers.requests_manager.JSON_FOLDER", tmp_path),
+            patch("managers.requests_manager.json.loads", wraps=json.loads) as mock_loads,
+        ):
+            _, first = request_manager.build_request("10.0.0.1", "/api/call", "p.json", False)
+            _, second = request_manager.build_request("10.0.0.1", "/api/call", "p.json", False)
+        assert first == second == {"a": 1}
+        mock_loads.assert_called_once()
+
+    def test_modified_file_is_reloaded(self, request_manager, tmp_path):
+        json_file = tmp_path / "p.json"
+        json_file.write_text('{"a": 1}', encoding="utf-8")
+        with patch("managers.requests_manager.JSON_FOLDER", tmp_path):
+            request_manager.build_request("10.0.0.1", "/api/call", "p.json", False)
+            json_file.write_text('{"a": 2}', encoding="utf-8")
+            # Force a distinct mtime even on filesystems with coarse timestamps
+            st = json_file.stat()
+            os.utime(json_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            _, payload = request_manager.build_request("10.0.0.1", "/api/call", "p.json", False)
+        assert payload == {"a": 2}
+
     def test_missing_json_file_gives_empty_payload(self, request_manager, tmp_path):
         with patch("managers.requests_manager.JSON_FOLDER", tmp_path):
             _, payload = request_manager.build_request("10.0.0.1", "/api/call", "ghost.json", False)
         assert payload == {}
 
+    def test_json_file_outside_folder_is_not_loaded(self, request_manager, tmp_path):
+        (tmp_path / "secret.json").write_text('{"a": 1}', encoding="utf-8")
+        folder = tmp_path / "json"
+        folder.mkdir()
+        with patch("managers.requests_manager.JSON_FOLDER", folder):
+            _, payload = request_manager.build_request("10.0.0.1", "/api/call", "../secret.json", False)
+        assert payload == {}
+
+    def test_backslash_json_file_path_is_loaded(self, request_manager, tmp_path):
+        (tmp_path / "get").mkdir()
+        (tmp_path / "get" / "p.json").write_text('{"a": 1}', encoding="utf-8")
+        with patch("managers.requests_manager.JSON_FOLDER", tmp_path):
+            _, payload = request_manager.build_request("10.0.0.1", "/api/call", "get\\p.json", False)
+        assert payload == {"a": 1}
+
 
 # ---------------------------------------------------------------------------
 # RequestManager.start_new_log
@@ -154,6 +222,15 @@ class TestRequestWorkerWriteLog:
         worker._write_log("body", "ok")
         assert "MyPreset" in log.read_text(encoding="utf-8")
 
+    def test_write_log_entry_layout(self, make_worker, tmp_path):
+        log = tmp_path / "log_MultiPreset_Run_20260101.log"
+        worker = make_worker(log_file=log)
+        worker._write_log("body", "ok")
+        lines = log.read_text(encoding="utf-8").splitlines()
+        assert lines[:2] == ["", "--- Preset: MyPreset ---"]
+        assert lines[3].startswith("--- ") and lines[3].endswith(" ---")
+        assert lines[4:] == ["Tag: ok", "body"]
+
     def test_ensure_log_file_sets_path_when_none(self, make_worker, tmp_path):
         worker = make_worker(log_file=None)
         with patch("managers.requests_manager.LOGS_FOLDER", tmp_path):
@@ -169,10 +246,9 @@ class TestRequestWorkerWriteLog:
 class TestRequestWorkerRun:
     """Test RequestWorker.run() by patching requests.post so no real network call happens.
 
-    run() calls self.finished.emit() at the end. Because we bypass QThread.__init__
-    via __new__, 'finished' is still the class-level Signal descriptor — we replace
-    it with a MagicMock on the instance so emit() can be inspected without a live
-    Qt event loop.
+    run() reports through self.signals. Because we bypass __init__ via __new__, the
+    factory gives each worker a MagicMock 'signals' so emit() can be inspected
+    without a live Qt event loop.
     """
 
     @pytest.fixture()
@@ -180,35 +256,52 @@ class TestRequestWorkerRun:
         w = make_worker(preset_name="RunTest", log_file=tmp_path / "run.log")
         w.password = bytearray(b"secret")
         w.payload = {"key": "val"}
-        w.finished = MagicMock()
         return w
 
     def test_run_success_emits_ok_tag(self, worker):
         """Successful 200 response → tag 'ok' emitted, password zeroed."""
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.text = '{"result":"ok"}'
+        mock_resp.content = b'{"result":"ok"}'
+        mock_resp.encoding = None
         mock_resp.elapsed.total_seconds.return_value = 0.05
 
         with patch("managers.requests_manager.requests.post", return_value=mock_resp):
             worker.run()
 
-        _, preset_name, tag = worker.finished.emit.call_args[0]
+        _, preset_name, tag = worker.signals.finished.emit.call_args[0]
         assert tag == "ok"
         assert preset_name == "RunTest"
         assert all(b == 0 for b in worker.password)
 
+    def test_run_posts_through_shared_session(self, worker):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = b"{}"
+        mock_resp.encoding = None
+        mock_resp.elapsed.total_seconds.return_value = 0.01
+        worker.session = MagicMock()
+        worker.session.post.return_value = mock_resp
+
+        with patch("managers.requests_manager.requests.post") as module_post:
+            worker.run()
+
+        worker.session.post.assert_called_once()
+        module_post.assert_not_called()
+        assert worker.signals.finished.emit.call_args[0][2] == "ok"
+
     def test_run_non_200_emits_warn_tag(self, worker):
         """Non-200 status → tag 'warn'."""
         mock_resp = MagicMock()
         mock_resp.status_code = 404
-        mock_resp.text = "Not Found"
+        mock_resp.content = b"Not Found"
+        mock_resp.encoding = None
         mock_resp.elapsed.total_seconds.return_value = 0.1
 
         with patch("managers.requests_manager.requests.post", return_value=mock_resp):
             worker.run()
 
-        _, _, tag = worker.finished.emit.call_args[0]
+        _, _, tag = worker.signals.finished.emit.call_args[0]
         assert tag == "warn"
 
     def test_run_network_error_emits_err_tag(self, worker):
@@ -219,7 +312,7 @@ class TestRequestWorkerRun:
                    side_effect=req_lib.exceptions.ConnectionError("refused")):
             worker.run()
 
-        _, _, tag = worker.finished.emit.call_args[0]
+        _, _, tag = worker.signals.finished.emit.call_args[0]
         assert tag == "err"
         assert all(b == 0 for b in worker.password)
 
@@ -227,7 +320,8 @@ class TestRequestWorkerRun:
         """run() must write the response to the log file."""
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.text = "response body"
+        mock_resp.content = b"response body"
+        mock_resp.encoding = None
         mock_resp.elapsed.total_seconds.return_value = 0.0
 
         with patch("managers.requests_manager.requests.post", return_value=mock_resp):
@@ -236,6 +330,157 @@ class TestRequestWorkerRun:
         assert worker.log_file.exists()
         assert "response body" in worker.log_file.read_text(encoding="utf-8")
 
+    def test_run_applies_formatter_to_emitted_text_only(self, worker):
+        """The formatter shapes the emitted text; the log keeps the raw response."""
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = b"raw body"
+        mock_resp.encoding = None
+        mock_resp.elapsed.total_seconds.return_value = 0.0
+        worker.formatter = lambda text: "FORMATTED"
+
+        with patch("managers.requests_manager.requests.post", return_value=mock_resp):
+            worker.run()
+
+        text, _, _ = worker.signals.finished.emit.call_args[0]
+        assert text == "FORMATTED"
+        assert "raw body" in worker.log_file.read_text(encoding="utf-8")
+
+    def test_run_truncates_oversized_text_for_display_only(self, worker):
+        """Huge responses are cut short and left unformatted; the log keeps them whole."""
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = b"x" * 500
+        mock_resp.encoding = None
+        mock_resp.elapsed.total_seconds.return_value = 0.0
+        worker.formatter = MagicMock()
+
+        with (
+            patch("managers.requests_manager._DISPLAY_MAX_CHARS", 100),
+            patch("managers.requests_manager.requests.post", return_value=mock_resp),
+        ):
+            worker.run()
+
+        text, _, _ = worker.signals.finished.emit.call_args[0]
+        assert text.endswith("more characters, see the log file")
+        assert len(text) < 200
+        worker.formatter.assert_not_called()
+        assert "x" * 500 in worker.log_file.read_text(encoding="utf-8")
+
+    def test_run_decodes_body_with_declared_or_utf8_charset(self, worker):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.elapsed.total_seconds.return_value = 0.0
+        mock_resp.content = "Zürich".encode("latin-1")
+        mock_resp.encoding = "ISO-8859-1"
+
+        with patch("managers.requests_manager.requests.post", return_value=mock_resp):
+            worker.run()
+        assert worker.signals.finished.emit.call_args[0][0].endswith("Zürich")
+
+        # No declared charset: UTF-8, with undecodable bytes replaced rather than guessed
+        worker.password = bytearray(b"secret")
+        mock_resp.encoding = None
+        with patch("managers.requests_manager.requests.post", return_value=mock_resp):
+            worker.run()
+        assert worker.signals.finished.emit.call_args[0][0].endswith("Z\ufffdrich")
+
+    def test_run_falls_back_to_utf8_for_unknown_charset(self, worker):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.elapsed.total_seconds.return_value = 0.0
+        mock_resp.content = "Zürich".encode("utf-8")
+        mock_resp.encoding = "x-bogus"
+
+        with patch("managers.requests_manager.requests.post", return_value=mock_resp):
+            worker.run()
+        assert worker.signals.finished.emit.call_args[0][0].endswith("Zürich")
+
+    def test_run_uses_prebuilt_payload_text(self, worker):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = b"{}"
+        mock_resp.encoding = None
+        mock_resp.elapsed.total_seconds.return_value = 0.0
+        worker.payload_text = "<cached>"
+
+        with patch("managers.requests_manager.requests.post", return_value=mock_resp):
+            worker.run()
+
+        text, _, _ = worker.signals.finished.emit.call_args[0]
+        assert "Payload: <cached>\n" in text
+
+    def test_run_posts_prebuilt_body(self, worker):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = b"{}"
+        mock_resp.encoding = None
+        mock_resp.elapsed.total_seconds.return_value = 0.0
+        worker.payload_body = b'{"a":1}'
+
+        with patch("managers.requests_manager.requests.post", return_value=mock_resp) as mock_post:
+            worker.run()
+
+        assert mock_post.call_args.kwargs["data"] == b'{"a":1}'
+        assert "json" not in mock_post.call_args.kwargs
+
+    def test_run_without_body_lets_requests_encode(self, worker):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = b"{}"
+        mock_resp.encoding = None
+        mock_resp.elapsed.total_seconds.return_value = 0.0
+        worker.payload = {"a": 1}
+
+        with patch("managers.requests_manager.requests.post", return_value=mock_resp) as mock_post:
+            worker.run()
+
+        assert mock_post.call_args.kwargs["json"] == {"a": 1}
+
+    def test_run_emits_done_after_finished(self, worker):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = b"{}"
+        mock_resp.encoding = None
+        mock_resp.elapsed.total_seconds.return_value = 0.0
+
+        with patch("managers.requests_manager.requests.post", return_value=mock_resp):
+            worker.run()
+
+        worker.signals.finished.emit.assert_called_once()
+        worker.signals.done.emit.assert_called_once_with()
+
+    def test_cancel_before_run_skips_request(self, worker):
+        """A worker cancelled while still queued never sends, but still reports done."""
+        worker.cancel()
+        assert all(b == 0 for b in worker.password)
+
+        with patch("managers.requests_manager.requests.post") as mock_post:
+            worker.run()
+
+        mock_post.assert_not_called()
+        worker.signals.finished.emit.assert_not_called()
+        worker.signals.done.emit.assert_called_once_with()
+
+    def test_cancel_during_request_discards_result(self, worker):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = b"late"
+        mock_resp.encoding = None
+        mock_resp.elapsed.total_seconds.return_value = 0.0
+
+        def post_then_cancel(*args, **kwargs):
+            worker.cancel()
+            return mock_resp
+
+        with patch("managers.requests_manager.requests.post", side_effect=post_then_cancel):
+            worker.run()
+
+        worker.signals.finished.emit.assert_not_called()
+        worker.signals.done.emit.assert_called_once_with()
+        # The response is still logged, since the request did reach the device
+        assert "late" in worker.log_file.read_text(encoding="utf-8")
+
 
 # ---------------------------------------------------------------------------
 # RequestManager._remove_worker / send_request_async
@@ -253,7 +498,7 @@ class TestRequestManagerWorkerTracking:
         request_manager._remove_worker(MagicMock())  # must not raise
 
     def test_send_request_async_starts_worker_and_returns_it(self, request_manager, tmp_path):
-        """send_request_async must build a worker, start it, and return it."""
+        """send_request_async must build a worker, queue it on the pool, and return it."""
         fake_worker = MagicMock()
         with (
             patch("managers.requests_manager.RequestWorker", return_value=fake_worker),
@@ -270,9 +515,97 @@ class TestRequestManagerWorkerTracking:
                 callback=MagicMock(),
             )
 
-        fake_worker.start.assert_called_once()
+        request_manager.pool.start.assert_called_once_with(fake_worker)
         assert result is fake_worker
 
+    def test_send_request_async_passes_formatter_to_worker(self, request_manager, tmp_path):
+        fmt = MagicMock()
+        with (
+            patch("managers.requests_manager.RequestWorker") as MockWorker,
+            patch("managers.requests_manager.JSON_FOLDER", tmp_path),
+        ):
+            request_manager.send_request_async(
+                ip="10.0.0.1",
+                user="admin",
+                password=bytearray(b"pw"),
+                endpoint="/api/test",
+                json_file=None,
+                simple_format=False,
+                json_type="normal",
+                callback=MagicMock(),
+                formatter=fmt,
+            )
+        assert MockWorker.call_args.kwargs["formatter"] is fmt
+
+    def test_send_request_async_passes_cached_payload_text(self, request_manager, tmp_path):
+        (tmp_path / "p.json").write_text('{"n": Infinity}', encoding="utf-8")
+        with (
+            patch("managers.requests_manager.RequestWorker") as MockWorker,
+            patch("managers.requests_manager.JSON_FOLDER", tmp_path),
+        ):
+            for _ in range(2):
+                request_manager.send_request_async(
+                    ip="10.0.0.1",
+                    user="admin",
+                    password=bytearray(b"pw"),
+                    endpoint="/api/test",
+                    json_file="p.json",
+                    simple_format=False,
+                    json_type="normal",
+                    callback=MagicMock(),
+                )
+        first, second = (c.kwargs["payload_text"] for c in MockWorker.call_args_list)
+        assert first == '{\n  "n": Infinity\n}'
+        assert second is first
+        # JSON has no Infinity, so there is no body to pre-encode
+        assert MockWorker.call_args.kwargs["payload_body"] is None
+
+    def test_send_request_async_passes_encoded_body(self, request_manager, tmp_path):
+        (tmp_path / "p.json").write_text('{"n": 1}', encoding="utf-8")
+        with (
+            patch("managers.requests_manager.RequestWorker") as MockWorker,
+            patch("managers.requests_manager.JSON_FOLDER", tmp_path),
+        ):
+            request_manager.send_request_async(
+                ip="10.0.0.1",
+                user="admin",
+                password=bytearray(b"pw"),
+                endpoint="/api/test",
+                json_file="p.json",
+                simple_format=False,
+                json_type="normal",
+                callback=MagicMock(),
+            )
+        assert json.loads(MockWorker.call_args.kwargs["payload_body"]) == {"n": 1}
+
+    def test_session_does_not_keep_cookies(self, request_manager):
+        import requests
+        from requests.cookies import MockRequest, create_cookie
+
+        request = MockRequest(requests.Request("POST", "http://10.0.0.1/api/call").prepare())
+        jar = request_manager.session.cookies
+        jar.set_cookie_if_ok(create_cookie("sid", "abc", domain="10.0.0.1"), request)
+        assert len(jar) == 0
+
+    def test_send_request_async_shares_session_with_worker(self, request_manager, tmp_path):
+        with (
+            patch("managers.requests_manager.RequestWorker") as MockWorker,
+            patch("managers.requests_manager.JSON_FOLDER", tmp_path),
+        ):
+            for _ in range(2):
+                request_manager.send_request_async(
+                    ip="10.0.0.1",
+                    user="admin",
+                    password=bytearray(b"pw"),
+                    endpoint="/api/test",
+                    json_file=None,
+                    simple_format=False,
+                    json_type="normal",
+                    callback=MagicMock(),
+                )
+        sessions = [c.kwargs["session"] for c in MockWorker.call_args_list]
+        assert sessions == [request_manager.session, request_manager.session]
+
 
 # ---------------------------------------------------------------------------
 # RequestWorker.__init__ (real constructor — lines 50-58)
@@ -296,6 +629,7 @@ class TestRequestWorkerInit:
         assert worker.preset_name == "MyPreset"
         assert worker.json_type == "google"
         assert worker.log_file is None
+        assert worker.formatter is None
 
 
 # ---------------------------------------------------------------------------
@@ -10,7 +10,7 @@ Same pattern as test_request_handling.py:
 """
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -38,11 +38,12 @@ def mixin():
     obj.endpoint_combo  = MagicMock()
     obj.endpoint_combo.findText.return_value = -1  # default: endpoint not found
     obj.json_combo      = MagicMock()
+    obj._settings_timer = MagicMock()
 
     # restoreGeometry / saveGeometry are QWidget methods — mock them
     obj.restoreGeometry = MagicMock()
     obj.saveGeometry    = MagicMock()
-    obj.saveGeometry.return_value.data.return_value.hex.return_value = "deadbeef"
+    obj.saveGeometry.return_value.toBase64.return_value.data.return_value = b"3q2+7w=="
 
     # Settings manager mock
     obj.settings = MagicMock()
@@ -83,9 +84,17 @@ class TestLoadSettings:
         mixin.json_type_combo.setCurrentText.assert_called_once_with("google")
 
     def test_restores_geometry_when_present(self, mixin):
+        mixin.settings.get_window_geometry.return_value = "3q2+7w=="
+        with patch("app.settings_handling.QByteArray") as MockByteArray:
+            mixin.load_settings()
+        MockByteArray.fromBase64.assert_called_once_with(b"3q2+7w==")
+        mixin.restoreGeometry.assert_called_once_with(MockByteArray.fromBase64.return_value)
+
+    def test_restores_legacy_hex_geometry(self, mixin):
         mixin.settings.get_window_geometry.return_value = "deadbeef"
+        mixin.restoreGeometry.return_value = False
         mixin.load_settings()
-        mixin.restoreGeometry.assert_called_once_with(bytes.fromhex("deadbeef"))
+        mixin.restoreGeometry.assert_called_with(bytes.fromhex("deadbeef"))
 
     def test_skips_restore_geometry_when_empty(self, mixin):
         mixin.settings.get_window_geometry.return_value = ""
@@ -130,14 +139,18 @@ class TestSaveSettings:
         mixin.save_settings()
         mixin.settings.set_last_simple_format.assert_called_once_with(False)
 
-    def test_saves_geometry_as_hex(self, mixin):
+    def test_saves_geometry_as_base64(self, mixin):
         mixin.save_settings()
-        mixin.settings.set_window_geometry.assert_called_once_with("deadbeef")
+        mixin.settings.set_window_geometry.assert_called_once_with("3q2+7w==")
 
     def test_calls_save_settings_on_manager(self, mixin):
         mixin.save_settings()
         mixin.settings.save_settings.assert_called_once()
 
+    def test_cancels_pending_auto_save(self, mixin):
+        mixin.save_settings()
+        mixin._settings_timer.stop.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # _auto_save_connection_settings
@@ -152,7 +165,8 @@ class TestAutoSaveConnectionSettings:
         mixin.settings.set_last_ip.assert_called_once_with("1.2.3.4")
         mixin.settings.set_last_user.assert_called_once_with("bob")
         mixin.settings.set_last_simple_format.assert_called_once_with(True)
-        mixin.settings.save_settings.assert_called_once()
+        mixin._settings_timer.start.assert_called_once()
+        mixin.settings.save_settings.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -170,6 +184,17 @@ class TestAutoSaveUiSettings:
         mixin.settings.set_last_json_type.assert_called_once_with("normal")
         mixin.settings.set_last_endpoint.assert_called_once_with("/api/foo")
         mixin.settings.set_last_json_file.assert_called_once_with("get/foo.json")
+        mixin._settings_timer.start.assert_called_once()
+        mixin.settings.save_settings.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# _flush_settings
+# ---------------------------------------------------------------------------
+
+class TestFlushSettings:
+    def test_writes_settings_once(self, mixin):
+        mixin._flush_settings()
         mixin.settings.save_settings.assert_called_once()
 
 
@@ -178,7 +203,7 @@ class TestAutoSaveUiSettings:
 # ---------------------------------------------------------------------------
 
 class TestAutoSaveGeometry:
-    def test_saves_geometry_hex(self, mixin):
+    def test_saves_geometry_base64(self, mixin):
         mixin._auto_save_geometry()
-        mixin.settings.set_window_geometry.assert_called_once_with("deadbeef")
+        mixin.settings.set_window_geometry.assert_called_once_with("3q2+7w==")
         mixin.settings.save_settings.assert_called_once()
@@ -19,6 +19,7 @@ def _make_manager(settings_file: Path):
             mgr = SettingsManager.__new__(SettingsManager)
             mgr.settings_file = settings_file
             mgr.settings = {}
+            mgr._saved = None
             mgr.load_settings()
             return mgr
 
@@ -29,6 +30,7 @@ def _fresh(tmp_path: Path) -> "SettingsManager":  # noqa: F821
     mgr = SettingsManager.__new__(SettingsManager)
     mgr.settings_file = tmp_path / "settings.json"
     mgr.settings = mgr._get_default_settings()
+    mgr._saved = None
     return mgr
 
 
@@ -138,17 +140,40 @@ class TestPersistence:
         mgr2 = SettingsManager.__new__(SettingsManager)
         mgr2.settings_file = mgr.settings_file
         mgr2.settings = {}
+        mgr2._saved = None
         mgr2.load_settings()
 
         assert mgr2.get_last_ip() == "192.168.1.42"
         assert mgr2.get_last_user() == "bob"
 
+    def test_unchanged_settings_are_not_rewritten(self, tmp_path):
+        mgr = _fresh(tmp_path)
+        mgr.set_last_ip("10.0.0.1")
+        mgr.save_settings()
+        with patch.object(Path, "open") as opened:
+            mgr.set_last_ip("10.0.0.1")
+            mgr.save_settings()
+        opened.assert_not_called()
+
+        mgr.set_last_ip("10.0.0.2")
+        mgr.save_settings()
+        assert json.loads(mgr.settings_file.read_text(encoding="utf-8"))["connection"]["last_ip"] == "10.0.0.2"
+
+    def test_loaded_settings_are_not_rewritten(self, tmp_path):
+        mgr = _fresh(tmp_path)
+        mgr.save_settings()
+        reloaded = _make_manager(mgr.settings_file)
+        with patch.object(Path, "open") as opened:
+            reloaded.save_settings()
+        opened.assert_not_called()
+
     def test_load_missing_file_uses_defaults(self, tmp_path):
         from managers.settings import SettingsManager
 
         mgr = SettingsManager.__new__(SettingsManager)
         mgr.settings_file = tmp_path / "nonexistent.json"
         mgr.settings = {}
+        mgr._saved = None
         mgr.load_settings()
 
         assert mgr.get_last_ip() == ""
@@ -162,6 +187,7 @@ class TestPersistence:
         mgr = SettingsManager.__new__(SettingsManager)
         mgr.settings_file = f
         mgr.settings = {}
+        mgr._saved = None
         mgr.load_settings()
 
         assert mgr.get_last_ip() == ""